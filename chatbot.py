@@ -38,8 +38,9 @@ except ImportError:
 # 📌 설정 파일 로드
 # ============================================================
 
+@st.cache_data(show_spinner=False)
 def load_yaml_config(filename):
-    """YAML 설정 파일 로드"""
+    """YAML 설정 파일 로드 (스크립트 재실행마다 다시 읽지 않도록 캐시)"""
     config_path = os.path.join('config', filename)
     if os.path.exists(config_path):
         with open(config_path, 'r', encoding='utf-8') as f:
@@ -133,7 +134,12 @@ if not GEMINI_API_KEY:
     st.error("⚠️ GEMINI_API_KEY가 설정되지 않았습니다!")
     st.stop()
 
-client = genai.Client(api_key=GEMINI_API_KEY)
+@st.cache_resource(show_spinner=False)
+def get_gemini_client(api_key):
+    """Gemini 클라이언트 생성 (프로세스당 1회, 재실행 시 재사용)"""
+    return genai.Client(api_key=api_key)
+
+client = get_gemini_client(GEMINI_API_KEY)
 
 
 # ============================================================
@@ -295,23 +301,47 @@ hide_streamlit_style = """
     [data-testid="stDecoration"] { display: none !important; }
     footer { display: none !important; }
     .main .block-container { padding-top: 2rem !important; }
+    html { scroll-behavior: smooth; }
+    #chat-end { scroll-margin-bottom: 0; }
 </style>
 """
 st.markdown(hide_streamlit_style, unsafe_allow_html=True)
 
+# 채팅 히스토리 끝 앵커 (새 메시지가 추가되면 이 위치로 스크롤)
+CHAT_END_ANCHOR = '<div id="chat-end"></div>'
+
+# 부모 문서에 스크롤 옵저버를 1회만 설치 (iframe이 사라져도 옵저버는 유지됨)
+CHAT_SCROLL_JS = """
+<script>
+    var doc = window.parent.document;
+    if (!window.parent.__chatEndObserver) {
+        var script = doc.createElement('script');
+        script.text = `
+            (function() {
+                var lastCount = 0;
+                window.__chatEndObserver = new MutationObserver(function() {
+                    var count = document.querySelectorAll('[data-testid="stChatMessage"]').length;
+                    if (count > lastCount) {
+                        var anchor = document.getElementById('chat-end');
+                        if (anchor) { anchor.scrollIntoView({block: "end"}); }
+                    }
+                    lastCount = count;
+                });
+                window.__chatEndObserver.observe(document.body, {childList: true, subtree: true});
+            })();
+        `;
+        doc.head.appendChild(script);
+    }
+</script>
+"""
 
-def scroll_to_bottom():
-    js = """
-    <script>
-        setTimeout(function() {
-            var messages = window.parent.document.querySelectorAll('[data-testid="stChatMessage"]');
-            if (messages.length > 0) {
-                messages[messages.length - 1].scrollIntoView({behavior: "smooth", block: "end"});
-            }
-        }, 300);
-    </script>
-    """
-    st.components.v1.html(js, height=0)
+
+def inject_chat_scroll_script():
+    """스크롤 옵저버 스크립트를 세션당 1회만 마운트"""
+    if st.session_state.setdefault('scroll_js_injected', False):
+        return
+    st.components.v1.html(CHAT_SCROLL_JS, height=0)
+    st.session_state.scroll_js_injected = True
 
 
 def initialize_session_state():
@@ -329,10 +359,6 @@ def initialize_session_state():
     if 'google_sheet' not in st.session_state:
         st.session_state.google_sheet = init_google_sheets()
     
-    # 스크롤 플래그 초기화
-    if 'should_scroll' not in st.session_state:
-        st.session_state.should_scroll = False
-    
     # ========== 🆕 대화 컨텍스트 저장용 (연속 질문 처리) ==========
     if 'last_mentioned_program' not in st.session_state:
         st.session_state.last_mentioned_program = None  # 마지막 언급된 제도 (복수전공, 융합전공 등)
@@ -360,7 +386,8 @@ def load_excel_data(file_path, sheet_name=0):
                 return list(result.values())[0] if result else pd.DataFrame()
             return result
         return pd.DataFrame()
-    except Exception as e:
+    except (OSError, ValueError) as e:
+        print(f"⚠️ {file_path} 로드 실패: {e}")
         return pd.DataFrame()
 
 
@@ -399,7 +426,8 @@ def load_curriculum_mapping():
         if os.path.exists('data/curriculum_mapping.xlsx'):
             return pd.read_excel('data/curriculum_mapping.xlsx')
         return pd.DataFrame(columns=['전공명', '제도유형', '파일명'])
-    except:
+    except (OSError, ValueError) as e:
+        print(f"⚠️ data/curriculum_mapping.xlsx 로드 실패: {e}")
         return pd.DataFrame(columns=['전공명', '제도유형', '파일명'])
 
 
@@ -409,10 +437,20 @@ def load_courses_data():
         if os.path.exists('data/courses.xlsx'):
             return pd.read_excel('data/courses.xlsx')
         return pd.DataFrame(columns=['전공명', '제도유형', '학년', '학기', '이수구분', '과목명', '학점'])
-    except:
+    except (OSError, ValueError) as e:
+        print(f"⚠️ data/courses.xlsx 로드 실패: {e}")
         return pd.DataFrame(columns=['전공명', '제도유형', '학년', '학기', '이수구분', '과목명', '학점'])
 
 
+@st.cache_data
+def load_courses_by_major():
+    """전공명별 교과목 인덱스 (전공명 → 교과목 DataFrame)"""
+    courses = load_courses_data()
+    if courses.empty or '전공명' not in courses.columns:
+        return {}
+    return {major: group for major, group in courses.groupby('전공명', sort=False)}
+
+
 @st.cache_data
 def load_faq_mapping():
     """faq_mapping.xlsx 로드"""
@@ -452,6 +490,7 @@ def load_primary_requirements():
 PROGRAM_INFO = load_program_info()
 CURRICULUM_MAPPING = load_curriculum_mapping()
 COURSES_DATA = load_courses_data()
+COURSES_BY_MAJOR = load_courses_by_major()
 FAQ_MAPPING = load_faq_mapping()
 MAJORS_INFO = load_majors_info()
 MICRODEGREE_INFO = load_microdegree_info()
@@ -3911,10 +3950,12 @@ def display_courses(major, program_type):
             clean_major = major[:last_open_paren].strip()
             display_major = clean_major
     
-    courses = COURSES_DATA[
-        (COURSES_DATA['전공명'] == clean_major) & 
-        (COURSES_DATA['제도유형'].apply(match_program_type_for_courses))
-    ]
+    # 전공명 인덱스로 해당 전공 교과목만 가져온 뒤 제도유형 매칭
+    major_courses = COURSES_BY_MAJOR.get(clean_major)
+    if major_courses is not None:
+        courses = major_courses[major_courses['제도유형'].apply(match_program_type_for_courses)]
+    else:
+        courses = COURSES_DATA.iloc[0:0]
     
     if courses.empty and is_micro:
         keyword = clean_major.replace('전공', '').replace('과정', '').replace('전문가', '').replace('MD', '').replace(' ', '').strip()
@@ -4133,7 +4174,6 @@ def render_question_buttons(questions, key_prefix, cols=5):
             st.session_state.chat_history.append({"role": "user", "content": q})
             response_text, res_type = generate_ai_response(q, st.session_state.chat_history[:-1], ALL_DATA)
             st.session_state.chat_history.append({"role": "assistant", "content": response_text, "response_type": res_type})
-            st.session_state.should_scroll = True  # 스크롤 플래그 설정
             st.rerun()
 
 
@@ -4349,10 +4389,8 @@ def main():
             with st.chat_message(chat["role"], avatar=avatar):
                 st.markdown(chat["content"], unsafe_allow_html=True)
         
-        # 스크롤 플래그 확인 및 실행
-        if st.session_state.should_scroll:
-            scroll_to_bottom()
-            st.session_state.should_scroll = False  # 플래그 리셋
+        # 새 메시지 자동 스크롤 (옵저버는 1회만 설치)
+        inject_chat_scroll_script()
         
         # 채팅 입력
         if prompt := st.chat_input("질문을 입력하세요..."):
@@ -4366,7 +4404,9 @@ def main():
                     st.markdown(response_text, unsafe_allow_html=True)
             
             st.session_state.chat_history.append({"role": "assistant", "content": response_text, "response_type": res_type})
-            scroll_to_bottom()
+        
+        # 채팅 히스토리 끝 앵커
+        st.markdown(CHAT_END_ANCHOR, unsafe_allow_html=True)
     
     elif menu == "다전공 제도 안내":
         st.markdown("""
@@ -0,0 +1,29 @@
+"""
+data/ 의 시뮬레이션 기준 엑셀 파일을 parquet으로 변환
+
+엑셀 파일은 편집용 원본으로 유지하고, simulation.read_excel_fast는
+엑셀보다 최신인 같은 이름의 parquet 파일이 있으면 그것을 읽는다.
+엑셀을 수정한 뒤 다시 실행: python convert_data.py
+"""
+import os
+
+import pandas as pd
+
+# simulation.py에서 읽는 기준 파일
+SOURCE_FILES = (
+    'data/primary_requirements.xlsx',
+    'data/graduation_requirements.xlsx',
+    'data/majors_info.xlsx',
+)
+
+
+def convert(path: str) -> str:
+    """엑셀 파일 하나를 같은 이름의 parquet으로 저장"""
+    parquet_path = os.path.splitext(path)[0] + '.parquet'
+    pd.read_excel(path).to_parquet(parquet_path, index=False)
+    return parquet_path
+
+
+if __name__ == "__main__":
+    for source in SOURCE_FILES:
+        print(f"{source} → {convert(source)}")
@@ -7,12 +7,18 @@
 ============================================================
 """
 
+import numpy as np
 import pandas as pd
 import streamlit as st
-from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Tuple
+from dataclasses import dataclass, field, fields, astuple, replace
+from typing import Optional, List, Dict, Tuple, NamedTuple
 from enum import Enum
+from functools import lru_cache
+from operator import attrgetter
 import os
+import string
+import re
+import logging
 
 # ============================================================
 # 상수 정의
@@ -24,6 +30,96 @@ TRANSFER_TOTAL_SEMESTERS = 4   # 편입학 총 학기
 MAX_DOUBLE_MAJOR_CREDITS = 130  # 복수전공 최대 졸업학점
 DEFAULT_GRADUATION_CREDITS = 120  # 기본 졸업학점
 
+# 입학구분별 총 학기 (그 외 편입학은 TRANSFER_TOTAL_SEMESTERS)
+TOTAL_SEMESTERS_BY_ADMISSION = {
+    "신입학": FRESHMAN_TOTAL_SEMESTERS,
+}
+
+# 복수전공 졸업학점 상한 예외 (그 외 전공은 MAX_DOUBLE_MAJOR_CREDITS)
+DOUBLE_MAJOR_CREDIT_CAPS = {
+    "건축학전공(5년제)": 164,
+}
+
+# 다전공 기준 데이터가 없을 때 제도별 기본 학점 (전공필수, 전공선택)
+DEFAULT_MULTI_REQUIREMENTS = {
+    "복수전공": (15, 21),
+    "부전공": (6, 15),
+    "융합전공": (15, 21),
+}
+DEFAULT_MULTI_REQUIREMENT_OTHER = (6, 15)
+
+# 다전공 기준 조회 실패 시 제도별 기본 기준 (전공필수, 전공선택, 계)
+DEFAULT_GRADUATION_REQUIREMENTS = {
+    "복수전공": (15, 21, 36),
+    "부전공": (6, 15, 21),
+    "융합전공": (15, 21, 36),
+    "융합부전공": (6, 15, 21),
+}
+DEFAULT_GRADUATION_REQUIREMENT_OTHER = (15, 21, 36)
+
+# 입학구분별 학기 순서 (학년, 표기) - 이수 학기 수를 인덱스로 사용
+FRESHMAN_SEMESTER_SCHEDULE = (
+    (1, "1학년 1학기"), (1, "1학년 2학기"),
+    (2, "2학년 1학기"), (2, "2학년 2학기"),
+    (3, "3학년 1학기"), (3, "3학년 2학기"),
+    (4, "4학년 1학기"), (4, "4학년 2학기"),
+)
+# 편입학: 3학년 편입
+TRANSFER_SEMESTER_SCHEDULE = (
+    (3, "3학년 1학기"), (3, "3학년 2학기"),
+    (4, "4학년 1학기"), (4, "4학년 2학기"),
+)
+
+# 학기당 필수 과목(전공필수/다전공필수) 최대 배정 학점
+MAX_REQUIRED_PER_SEMESTER = 6
+
+# 기본 정보 입력 선택지
+ADMISSION_YEAR_OPTIONS = tuple(range(2025, 2019, -1))
+ADMISSION_TYPE_OPTIONS = ("신입학", "3학년 편입학(동일계)", "3학년 편입학(비동일계)")
+FRESHMAN_SEMESTER_OPTIONS = tuple(range(1, FRESHMAN_TOTAL_SEMESTERS + 1))
+TRANSFER_SEMESTER_OPTIONS = tuple(range(1, TRANSFER_TOTAL_SEMESTERS + 1))
+CURRENT_PROGRAM_OPTIONS = ("복수전공", "부전공", "융합전공", "융합부전공", "연계전공")
+
+# 학기별 학점 배정 우선순위 (항목, 학기당 상한)
+# 1학년, 4학년: 교양 우선
+LIBERAL_FIRST_PRIORITY = (
+    ("basic_literacy", None),
+    ("basic_science", None),
+    ("core_liberal", None),
+    ("major_required", MAX_REQUIRED_PER_SEMESTER),
+    ("multi_required", MAX_REQUIRED_PER_SEMESTER),
+    ("major_elective", None),
+    ("multi_elective", None),
+    ("free", None),
+)
+# 2-3학년: 전공 우선
+MAJOR_FIRST_PRIORITY = (
+    ("major_required", MAX_REQUIRED_PER_SEMESTER),
+    ("multi_required", MAX_REQUIRED_PER_SEMESTER),
+    ("major_elective", None),
+    ("multi_elective", None),
+    ("basic_literacy", None),
+    ("basic_science", None),
+    ("core_liberal", None),
+    ("free", None),
+)
+
+# 학기별 이수 계획 항목 (SemesterPlan 필드 순서)
+PLAN_ITEMS = (
+    "basic_literacy",
+    "basic_science",
+    "core_liberal",
+    "major_required",
+    "major_elective",
+    "multi_required",
+    "multi_elective",
+    "free",
+)
+
+# 우선순위 테이블의 인덱스 버전 (PLAN_ITEMS 위치, 학기당 상한)
+_LIBERAL_FIRST_ORDER = tuple((PLAN_ITEMS.index(key), cap) for key, cap in LIBERAL_FIRST_PRIORITY)
+_MAJOR_FIRST_ORDER = tuple((PLAN_ITEMS.index(key), cap) for key, cap in MAJOR_FIRST_PRIORITY)
+
 # 제도 우선순위 (숫자가 낮을수록 우선)
 PROGRAM_PRIORITY = {
     "복수전공": 1,
@@ -33,6 +129,25 @@ PROGRAM_PRIORITY = {
     "연계전공": 5,
 }
 
+# 이수 가능 여부 정렬 점수 (가능 > 위험 > 어려움)
+GRADUATION_STATUS_SCORE = {"가능": 0, "위험": 1, "어려움": 2}
+
+# 이수 가능 여부별 추천 사유 (그 외 상태는 GRADUATION_STATUS_REASON_DEFAULT)
+GRADUATION_STATUS_REASONS = {
+    "가능": "남은 {remaining_semesters}학기 내 이수 가능",
+    "위험": "학기당 집중 이수 시 이수 가능",
+}
+GRADUATION_STATUS_REASON_DEFAULT = "현재 학점으로는 졸업이 어려움"
+
+# 제도별 추천 사유
+PROGRAM_RECOMMENDATION_REASONS = {
+    "복수전공": "학위 2개 취득 가능",
+    "부전공": "비교적 적은 학점으로 이수 가능",
+    "융합전공": "융합적 역량 강화",
+    "융합부전공": "적은 학점으로 융합 역량 확보",
+    "연계전공": "다양한 학문 간 연계 학습",
+}
+
 # ============================================================
 # 열거형 정의
 # ============================================================
@@ -56,7 +171,7 @@ class GraduationStatus(Enum):
 # 데이터 클래스
 # ============================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StudentInput:
     """학생 입력 정보"""
     # 기본 정보
@@ -87,9 +202,22 @@ class StudentInput:
     current_multi_major: Optional[str] = None
     credits_multi_required: int = 0
     credits_multi_elective: int = 0
+    
+    @property
+    def total_completed(self) -> int:
+        """입력한 전 영역 이수 학점 합계 (편입학 인정학점 제외)"""
+        return sum(_STUDENT_CREDITS(self))
 
 
-@dataclass
+# StudentInput의 영역별 이수 학점 (total_completed 합산 대상)
+_STUDENT_CREDITS = attrgetter(
+    'credits_basic_literacy', 'credits_basic_science', 'credits_core_liberal',
+    'credits_major_required', 'credits_major_elective', 'credits_free',
+    'credits_multi_required', 'credits_multi_elective',
+)
+
+
+@dataclass(slots=True)
 class CreditAnalysis:
     """학점 분석 결과"""
     # 기준 학점
@@ -135,9 +263,52 @@ class CreditAnalysis:
     # 본전공 변화 학점 (다전공 참여 시)
     req_major_required_changed: int = 0
     req_major_elective_changed: int = 0
-
-
-@dataclass
+    
+    # 총 전공 부족 학점 (본전공 + 다전공)
+    total_deficit: int = 0
+
+
+class PrimaryRequirement(NamedTuple):
+    """본전공 기준 (primary_requirements.xlsx 1행)"""
+    major_name: str                      # 전공명
+    program_type: str                    # 제도유형
+    admission_year: int                  # 기준학번
+    req_major_required: int              # 본전공 전공필수
+    req_major_elective: int              # 본전공 전공선택
+    req_total: int                       # 본전공 계
+    req_major_required_changed: int      # 다전공 참여 시 본전공 전공필수
+    req_major_elective_changed: int      # 다전공 참여 시 본전공 전공선택
+    req_basic_literacy: Optional[int]    # 기초교양(기초문해), 없으면 None
+    req_basic_science: Optional[int]     # 기초교양(기초과학), 없으면 None
+    req_core_liberal: Optional[int]      # 핵심교양, 없으면 None
+    req_graduation_credits: int          # 졸업학점
+
+
+class GraduationRequirement(NamedTuple):
+    """다전공 기준 (graduation_requirements.xlsx 1행)"""
+    major_name: str                      # 전공명
+    program_type: str                    # 제도유형
+    admission_year: int                  # 기준학번
+    req_multi_required: int              # 다전공 전공필수
+    req_multi_elective: int              # 다전공 전공선택
+    req_total: int                       # 다전공 계
+
+
+class SemesterPlan(NamedTuple):
+    """학기별 이수 계획 (필드 순서 = 표 컬럼 순서)"""
+    semester: str                        # 학년/학기 표기
+    basic_literacy: int = 0              # 기초교양(기초문해)
+    basic_science: int = 0               # 기초교양(기초과학)
+    core_liberal: int = 0                # 핵심교양
+    major_required: int = 0              # 본전공 필수
+    major_elective: int = 0              # 본전공 선택
+    multi_required: int = 0              # 다전공 필수
+    multi_elective: int = 0              # 다전공 선택
+    free: int = 0                        # 자유학점
+    total: int = 0                       # 합계
+
+
+@dataclass(slots=True)
 class SimulationResult:
     """제도별 비교 분석 결과"""
     program_type: str                    # 제도 유형
@@ -156,10 +327,10 @@ class SimulationResult:
     is_supplementary: bool = False
     
     # 학기별 이수 계획
-    semester_plan: List[Dict] = field(default_factory=list)
+    semester_plan: List[SemesterPlan] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisOutput:
     """전체 분석 결과"""
     student_input: StudentInput = None
@@ -180,261 +351,546 @@ class AnalysisOutput:
 # 데이터 로드 함수
 # ============================================================
 
+def read_excel_fast(path: str) -> pd.DataFrame:
+    """엑셀 파일 읽기 (디스크 캐시 사용, 파일 수정 시각이 바뀌면 다시 읽음)
+    
+    엑셀보다 최신인 같은 이름의 parquet 파일이 있으면 parquet을 읽음 (convert_data.py로 생성)
+    """
+    mtime = os.path.getmtime(path)
+    parquet_path = os.path.splitext(path)[0] + '.parquet'
+    if os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= mtime:
+        return pd.read_parquet(parquet_path)
+    return _read_excel_persisted(path, mtime)
+
+@st.cache_data(persist="disk", show_spinner=False)
+def _read_excel_persisted(path: str, mtime: float) -> pd.DataFrame:
+    """엑셀 파일 읽기 (calamine 엔진 우선, 미설치 시 기본 엔진)
+    
+    mtime은 캐시 키로만 사용 (재시작 후에도 파일이 그대로면 파싱 생략)
+    """
+    try:
+        return pd.read_excel(path, engine='calamine')
+    except ImportError:
+        return pd.read_excel(path)
+
+# 본전공 기준 정수 컬럼: 정규 컬럼명 → (엑셀 컬럼명 후보, 기본값)
+# 후보 중 처음으로 값이 있는 컬럼을 사용, 숫자가 아니면 기본값 (None이면 빈 값 유지)
+PRIMARY_REQUIREMENT_COLUMNS = {
+    '본전공_전공필수': (('본전공_전공필수', '본전공 전공필수'), 15),
+    '본전공_전공선택': (('본전공_전공선택', '본전공 전공선택'), 33),
+    '본전공_계': (('본전공_계', '본전공 계'), 48),
+    '본전공변화_전공필수': (('본전공변화_전공필수', '본전공변화 전공필수', '본전공_전공필수', '본전공 전공필수'), 15),
+    '본전공변화_전공선택': (('본전공변화_전공선택', '본전공변화 전공선택', '본전공_전공선택', '본전공 전공선택'), 33),
+    '기초교양_기초문해': (('기초교양(기초문해)', '기초교양_기초문해', '기초문해'), None),
+    '기초교양_기초과학': (('기초교양(기초과학)', '기초교양_기초과학', '기초과학'), None),
+    '핵심교양': (('핵심교양', '핵심 교양'), None),
+    '졸업학점': (('졸업학점', '졸업 학점'), 120),
+}
+
+# 다전공 기준 정수 컬럼
+GRADUATION_REQUIREMENT_COLUMNS = {
+    '다전공_전공필수': (('다전공_전공필수',), 15),
+    '다전공_전공선택': (('다전공_전공선택',), 21),
+    '다전공_계': (('다전공_계',), 36),
+}
+
+
+def coerce_requirement_columns(df: pd.DataFrame, columns: Dict[str, Tuple]) -> pd.DataFrame:
+    """기준 컬럼을 정규 컬럼명의 정수 컬럼으로 일괄 변환"""
+    if df.empty:
+        return df
+    coerced = {}
+    for name, (candidates, default) in columns.items():
+        present = [c for c in candidates if c in df.columns]
+        if present:
+            # 후보 컬럼 중 첫 번째로 비어 있지 않은 값
+            values = df[present].bfill(axis=1).iloc[:, 0]
+        else:
+            values = pd.Series(np.nan, index=df.index)
+        values = pd.to_numeric(values, errors='coerce')
+        if default is None:
+            coerced[name] = np.trunc(values).astype('Int64')
+        else:
+            coerced[name] = np.trunc(values.fillna(default)).astype('int64')
+    return df.assign(**coerced)
+
 @st.cache_data
 def load_primary_requirements():
     """본전공 기준 데이터 로드"""
     try:
-        return pd.read_excel('data/primary_requirements.xlsx')
-    except:
+        return coerce_requirement_columns(
+            read_excel_fast('data/primary_requirements.xlsx'), PRIMARY_REQUIREMENT_COLUMNS
+        )
+    except (OSError, ValueError) as e:
+        logging.warning(f"data/primary_requirements.xlsx 로드 실패: {e}")
         return pd.DataFrame()
 
 @st.cache_data
 def load_graduation_requirements():
     """다전공 기준 데이터 로드"""
     try:
-        return pd.read_excel('data/graduation_requirements.xlsx')
-    except:
+        return coerce_requirement_columns(
+            read_excel_fast('data/graduation_requirements.xlsx'), GRADUATION_REQUIREMENT_COLUMNS
+        )
+    except (OSError, ValueError) as e:
+        logging.warning(f"data/graduation_requirements.xlsx 로드 실패: {e}")
+        return pd.DataFrame()
+
+@st.cache_data
+def load_majors_info():
+    """전공 정보 데이터 로드"""
+    try:
+        majors_info_df = read_excel_fast('data/majors_info.xlsx')
+    except (OSError, ValueError) as e:
+        logging.warning(f"data/majors_info.xlsx 로드 실패: {e}")
         return pd.DataFrame()
+    
+    # 계열은 정렬된 범주형으로 저장 (계열 정렬은 로드 시 한 번만)
+    if '계열' in majors_info_df.columns:
+        majors_info_df['계열'] = pd.Categorical(
+            majors_info_df['계열'],
+            categories=sorted(majors_info_df['계열'].dropna().unique()),
+            ordered=True
+        )
+    return majors_info_df
+
+@st.cache_data
+def load_major_type_map():
+    """전공명 → 제도유형 매핑 로드 (제도유형이 비어 있는 전공은 제외, 값은 str)"""
+    majors_info_df = load_majors_info()
+    if majors_info_df.empty or '제도유형' not in majors_info_df.columns:
+        return {}
+    first_rows = majors_info_df.drop_duplicates(subset='전공명', keep='first')
+    first_rows = first_rows[first_rows['제도유형'].notna()]
+    return dict(zip(first_rows['전공명'], first_rows['제도유형'].astype(str)))
 
 @st.cache_data
 def load_majors_list():
     """전공 목록 로드"""
     try:
-        majors_df = pd.read_excel('data/majors_info.xlsx')
+        majors_df = load_majors_info()
         return sorted(majors_df['전공명'].unique().tolist())
-    except:
+    except (KeyError, TypeError):
+        # 파일 로드 실패(빈 DataFrame) 또는 전공명 컬럼 이상
         return []
 
 @st.cache_data
+def load_majors_by_program_type():
+    """제도유형 → 다전공 기준이 있는 전공명 집합 로드"""
+    gr_df = load_graduation_requirements()
+    if gr_df.empty or '제도유형' not in gr_df.columns:
+        return {}
+    return {
+        program_type: frozenset(group['전공명'])
+        for program_type, group in gr_df.groupby('제도유형')
+    }
+
+@st.cache_data
+def load_multi_majors_by_program_type():
+    """제도유형 → 정렬된 다전공 목록 로드 (모든 제도유형을 한 번에 생성)"""
+    multi_majors = {}
+    for program_type, majors in load_majors_by_program_type().items():
+        try:
+            multi_majors[program_type] = sorted(majors)
+        except TypeError:
+            # 전공명 컬럼 이상 (정렬 불가)
+            multi_majors[program_type] = []
+    return multi_majors
+
 def load_multi_majors_by_program(program_type: str):
     """제도별 다전공 목록 로드"""
-    try:
-        gr_df = pd.read_excel('data/graduation_requirements.xlsx')
-        filtered = gr_df[gr_df['제도유형'] == program_type]
-        return sorted(filtered['전공명'].unique().tolist())
-    except:
-        return []
+    return load_multi_majors_by_program_type().get(program_type, [])
+
+
+def program_type_mask(majors_df: pd.DataFrame, program_type: str) -> pd.Series:
+    """제도유형 문자열에 program_type이 포함된 행 마스크
+    
+    제도유형은 값의 종류가 적으므로 고유값마다 한 번만 비교 (빈 값은 False)
+    """
+    codes, uniques = pd.factorize(majors_df['제도유형'])
+    hits = np.array([program_type in str(value) for value in uniques] + [False], dtype=bool)
+    return pd.Series(hits[codes], index=majors_df.index)
+
+
+def category_separator(category: str) -> str:
+    """계열 구분선 옵션 문자열"""
+    return f"━━━━━ 📚 {category} ━━━━━"
+
+@st.cache_data
+def load_category_separators():
+    """선택 옵션에 들어가는 모든 계열 구분선 집합 로드"""
+    majors_info_df = load_majors_info()
+    if majors_info_df.empty or '계열' not in majors_info_df.columns:
+        return frozenset()
+    return frozenset(category_separator(category) for category in majors_info_df['계열'].unique())
+
+
+def group_major_options(majors_df: pd.DataFrame) -> List[str]:
+    """계열별 구분선 + 정렬된 전공명 목록 생성 (selectbox 옵션용)"""
+    # 계열 순서대로 정렬된 전공명 목록 (한 번의 groupby로 생성, 전공이 없는 계열은 제외)
+    majors_by_category = majors_df.sort_values('전공명').groupby('계열', observed=True)['전공명'].apply(list)
+    options = []
+    for category, category_majors in majors_by_category.items():
+        # 계열 구분선 추가
+        options.append(category_separator(category))
+        # 해당 계열의 전공들 추가
+        options.extend(category_majors)
+    return options
+
+@st.cache_data
+def load_primary_major_options():
+    """본전공 선택 옵션 로드 (융합전공 제외, 계열별 구분)"""
+    majors_info_df = load_majors_info()
+    # 제도유형에 '융합전공'이 포함되지 않은 전공만
+    primary_majors_df = majors_info_df[~program_type_mask(majors_info_df, '융합전공')]
+    return group_major_options(primary_majors_df)
+
+@st.cache_data
+def load_multi_major_options(program_type: str, extra_program_type: str):
+    """다전공 선택 옵션 로드 (계열별 구분)
+    
+    program_type 기준이 있는 전공 + 제도유형에 extra_program_type이 포함된 전공
+    """
+    majors_info_df = load_majors_info()
+    program_majors = load_majors_by_program_type().get(program_type, frozenset())
+    available_majors = majors_info_df[
+        (majors_info_df['전공명'].isin(program_majors)) |
+        program_type_mask(majors_info_df, extra_program_type)
+    ]
+    return group_major_options(available_majors)
+
+
+class RequirementIndex(NamedTuple):
+    """기준 조회 인덱스
+    
+    records: (전공명, 제도유형, 기준학번) → 첫 번째 행의 기준 레코드 (index_requirement_keys는 행 위치)
+    years: (전공명, 제도유형) → 기준학번 목록 (데이터 등장 순서, 가까운 학번 대체용)
+    keys_by_program: 제도유형 → 기준 키 목록 (데이터 등장 순서, 부분 매칭용)
+    """
+    records: Dict[Tuple, object]
+    years: Dict[Tuple, Tuple[int, ...]]
+    keys_by_program: Dict[str, Tuple[Tuple, ...]]
+
+
+def index_requirement_keys(df: pd.DataFrame) -> RequirementIndex:
+    """기준 DataFrame → 키별 첫 번째 행 위치 인덱스 생성 (레코드는 만들지 않음)"""
+    positions = {}
+    years = {}
+    keys_by_program = {}
+    if df.empty:
+        return RequirementIndex(positions, years, keys_by_program)
+    for position, key in enumerate(zip(df['전공명'], df['제도유형'], df['기준학번'])):
+        if key not in positions:
+            positions[key] = position
+            years.setdefault(key[:2], []).append(key[2])
+            keys_by_program.setdefault(key[1], []).append(key)
+    return RequirementIndex(
+        positions,
+        {key: tuple(values) for key, values in years.items()},
+        {key: tuple(values) for key, values in keys_by_program.items()},
+    )
+
+
+def build_requirement_index(df: pd.DataFrame, build_record) -> RequirementIndex:
+    """기준 DataFrame → 기준 레코드 인덱스 생성"""
+    index = index_requirement_keys(df)
+    if not index.records:
+        return index
+    rows = df.to_dict('records')
+    return index._replace(records={
+        key: build_record(rows[position], key[2])
+        for key, position in index.records.items()
+    })
+
+
+# 부분 매칭 키워드에서 제거할 표기 ('전공', 캠퍼스 표기)
+_MAJOR_KEYWORD_STRIP = re.compile(r'전공|\(평캠\)|\(평택\)')
+
+
+@lru_cache(maxsize=512)
+def major_keyword(major: str) -> str:
+    """부분 매칭용 전공명 키워드 ('전공', 캠퍼스 표기 제거)"""
+    return _MAJOR_KEYWORD_STRIP.sub('', major).strip()
+
+
+def closest_year_record(index: RequirementIndex, major: str, program_type: str, admission_year: int):
+    """(전공명, 제도유형)이 일치하는 기준 중 admission_year와 가장 가까운 학번의 레코드"""
+    years = index.years.get((major, program_type))
+    if not years:
+        return None
+    closest_year = min(years, key=lambda x: abs(x - admission_year))
+    return index.records[(major, program_type, closest_year)]
+
+
+def lookup_requirement(
+    index: RequirementIndex,
+    major: str,
+    program_type: str,
+    admission_year: int,
+    keyword_closest_year: bool
+):
+    """인덱스로 기준 레코드(키 위치 인덱스면 행 위치) 조회 (DataFrame 검색과 같은 순서로 대체)
+    
+    1차 정확한 매칭 → 2차 부분 매칭(같은 학번) → 3차 같은 전공의 가까운 학번
+    → (keyword_closest_year이면) 4차 부분 매칭의 가까운 학번
+    """
+    record = index.records.get((major, program_type, admission_year))
+    if record is not None:
+        return record
+    
+    keyword = major_keyword(major)
+    keyword_keys = []
+    if keyword:
+        # str.contains(keyword, case=False)와 같은 정규식 검색
+        pattern = re.compile(keyword, re.IGNORECASE)
+        keyword_keys = [
+            key for key in index.keys_by_program.get(program_type, ())
+            if isinstance(key[0], str) and pattern.search(key[0])
+        ]
+        for key in keyword_keys:
+            if key[2] == admission_year:
+                return index.records[key]
+    
+    record = closest_year_record(index, major, program_type, admission_year)
+    if record is not None:
+        return record
+    
+    if keyword_closest_year and keyword_keys:
+        closest_year = min(dict.fromkeys(key[2] for key in keyword_keys), key=lambda x: abs(x - admission_year))
+        return next(index.records[key] for key in keyword_keys if key[2] == closest_year)
+    
+    return None
+
+# 인덱스는 읽기 전용이므로 cache_resource로 공유 (호출마다 복사하지 않음)
+@st.cache_resource(show_spinner=False)
+def load_primary_requirement_index():
+    """본전공 기준 인덱스 로드"""
+    return build_requirement_index(load_primary_requirements(), _build_primary_requirement)
+
+@st.cache_resource(show_spinner=False)
+def load_graduation_requirement_index():
+    """다전공 기준 인덱스 로드"""
+    return build_requirement_index(load_graduation_requirements(), _build_graduation_requirement)
 
 
 def safe_int(value, default=0):
-    """안전하게 정수로 변환"""
+    """안전하게 정수로 변환 (None, NaN, 변환 불가 값은 default)"""
+    # NaN만 자기 자신과 같지 않음 (pd.NA, NaT 등은 int()에서 예외 → default)
+    if value is None or (isinstance(value, float) and value != value):
+        return default
     try:
-        if pd.isna(value):
-            return default
         return int(value)
     except (ValueError, TypeError):
         return default
 
 
+def optional_int(value) -> Optional[int]:
+    """빈 값은 None, 그 외는 정수"""
+    return None if pd.isna(value) else int(value)
+
+
 def get_primary_requirement(
     primary_major: str,
     program_type: str,
     admission_year: int,
-    pr_df: pd.DataFrame
-) -> Optional[Dict]:
-    """본전공 기준 조회"""
+    pr_df: pd.DataFrame,
+    pr_index: Optional[RequirementIndex] = None
+) -> Optional[PrimaryRequirement]:
+    """본전공 기준 조회 (pr_index가 없으면 pr_df의 키 인덱스로 조회)"""
     if pr_df.empty:
         return None
     
-    # 1차: 정확한 매칭 (전공명, 제도유형, 기준학번 모두 일치)
-    result = pr_df[
-        (pr_df['전공명'] == primary_major) &
-        (pr_df['제도유형'] == program_type) &
-        (pr_df['기준학번'] == admission_year)
-    ]
-    
-    if result.empty:
-        # 2차: 부분 매칭 시도 (전공명에 키워드 포함)
-        keyword = primary_major.replace('전공', '').replace('(평캠)', '').replace('(평택)', '').strip()
-        if keyword:
-            result = pr_df[
-                (pr_df['전공명'].str.contains(keyword, case=False, na=False)) &
-                (pr_df['제도유형'] == program_type) &
-                (pr_df['기준학번'] == admission_year)
-            ]
-    
-    if result.empty:
-        # 3차: 가장 가까운 학번으로 대체 (전공명, 제도유형은 일치)
-        result = pr_df[
-            (pr_df['전공명'] == primary_major) &
-            (pr_df['제도유형'] == program_type)
-        ]
-        if not result.empty:
-            closest_year = min(result['기준학번'].unique(), key=lambda x: abs(x - admission_year))
-            result = result[result['기준학번'] == closest_year]
-    
-    if result.empty:
-        # 4차: 제도유형만 일치하고 전공명으로 검색
-        keyword = primary_major.replace('전공', '').replace('(평캠)', '').replace('(평택)', '').strip()
-        if keyword:
-            result = pr_df[
-                (pr_df['전공명'].str.contains(keyword, case=False, na=False)) &
-                (pr_df['제도유형'] == program_type)
-            ]
-            if not result.empty:
-                # 가장 가까운 학번 선택
-                closest_year = min(result['기준학번'].unique(), key=lambda x: abs(x - admission_year))
-                result = result[result['기준학번'] == closest_year]
-    
-    if result.empty:
-        # 데이터를 찾지 못함
-        return None
-    
-    row = result.iloc[0]
-    
-    # 안전하게 값 추출 (여러 컬럼명 패턴 시도)
-    def safe_get_multi_pattern(patterns, default=None):
-        """여러 컬럼명 패턴을 시도하여 값 가져오기"""
-        for pattern in patterns:
-            if pattern in row.index:
-                val = row[pattern]
-                if pd.notna(val):
-                    return safe_int(val, default)
-        return default
-    
-    return {
-        'major_name': row['전공명'],
-        'program_type': row['제도유형'],
-        'admission_year': safe_int(row.get('기준학번'), admission_year),
-        'req_major_required': safe_get_multi_pattern(['본전공_전공필수', '본전공 전공필수'], 15),
-        'req_major_elective': safe_get_multi_pattern(['본전공_전공선택', '본전공 전공선택'], 33),
-        'req_total': safe_get_multi_pattern(['본전공_계', '본전공 계'], 48),
-        'req_major_required_changed': safe_get_multi_pattern(
-            ['본전공변화_전공필수', '본전공변화 전공필수', '본전공_전공필수', '본전공 전공필수'], 
-            15
-        ),
-        'req_major_elective_changed': safe_get_multi_pattern(
-            ['본전공변화_전공선택', '본전공변화 전공선택', '본전공_전공선택', '본전공 전공선택'], 
-            33
-        ),
-        'req_basic_literacy': safe_get_multi_pattern(['기초교양(기초문해)', '기초교양_기초문해', '기초문해'], None),
-        'req_basic_science': safe_get_multi_pattern(['기초교양(기초과학)', '기초교양_기초과학', '기초과학'], None),
-        'req_core_liberal': safe_get_multi_pattern(['핵심교양', '핵심 교양'], None),
-        'req_graduation_credits': safe_get_multi_pattern(['졸업학점', '졸업 학점'], 120),
-    }
+    if pr_index is None:
+        # 키 위치만 인덱싱하고 찾은 행 하나만 레코드로 변환
+        position = lookup_requirement(
+            index_requirement_keys(pr_df), primary_major, program_type, admission_year, keyword_closest_year=True
+        )
+        if position is None:
+            # 데이터를 찾지 못함
+            return None
+        return _build_primary_requirement(pr_df.iloc[position], admission_year)
+    
+    # 데이터를 찾지 못하면 None
+    return lookup_requirement(pr_index, primary_major, program_type, admission_year, keyword_closest_year=True)
+
+
+def _build_primary_requirement(row, admission_year: int) -> PrimaryRequirement:
+    """본전공 기준 행(Series 또는 dict) → 기준 레코드
+    
+    정수 컬럼은 load_primary_requirements에서 이미 변환됨 (PRIMARY_REQUIREMENT_COLUMNS)
+    """
+    return PrimaryRequirement(
+        major_name=row['전공명'],
+        program_type=row['제도유형'],
+        admission_year=safe_int(row.get('기준학번'), admission_year),
+        req_major_required=int(row['본전공_전공필수']),
+        req_major_elective=int(row['본전공_전공선택']),
+        req_total=int(row['본전공_계']),
+        req_major_required_changed=int(row['본전공변화_전공필수']),
+        req_major_elective_changed=int(row['본전공변화_전공선택']),
+        req_basic_literacy=optional_int(row['기초교양_기초문해']),
+        req_basic_science=optional_int(row['기초교양_기초과학']),
+        req_core_liberal=optional_int(row['핵심교양']),
+        req_graduation_credits=int(row['졸업학점']),
+    )
 
 
 def get_graduation_requirement(
     multi_major: str,
     program_type: str,
     admission_year: int,
-    gr_df: pd.DataFrame
-) -> Optional[Dict]:
-    """다전공 기준 조회"""
+    gr_df: pd.DataFrame,
+    gr_index: Optional[RequirementIndex] = None
+) -> Optional[GraduationRequirement]:
+    """다전공 기준 조회 (gr_index가 없으면 gr_df의 키 인덱스로 조회)"""
     if gr_df.empty:
         return None
     
-    result = gr_df[
-        (gr_df['전공명'] == multi_major) &
-        (gr_df['제도유형'] == program_type) &
-        (gr_df['기준학번'] == admission_year)
-    ]
+    if gr_index is None:
+        # 키 위치만 인덱싱하고 찾은 행 하나만 레코드로 변환
+        position = lookup_requirement(
+            index_requirement_keys(gr_df), multi_major, program_type, admission_year, keyword_closest_year=False
+        )
+        record = None if position is None else _build_graduation_requirement(gr_df.iloc[position], admission_year)
+    else:
+        record = lookup_requirement(gr_index, multi_major, program_type, admission_year, keyword_closest_year=False)
     
-    if result.empty:
-        # 부분 매칭 시도
-        keyword = multi_major.replace('전공', '').replace('(평캠)', '').replace('(평택)', '').strip()
-        if keyword:
-            result = gr_df[
-                (gr_df['전공명'].str.contains(keyword, case=False, na=False)) &
-                (gr_df['제도유형'] == program_type) &
-                (gr_df['기준학번'] == admission_year)
-            ]
+    if record is None:
+        # 기본값 반환
+        req, elec, total = DEFAULT_GRADUATION_REQUIREMENTS.get(program_type, DEFAULT_GRADUATION_REQUIREMENT_OTHER)
+        return GraduationRequirement(
+            major_name=multi_major,
+            program_type=program_type,
+            admission_year=admission_year,
+            req_multi_required=req,
+            req_multi_elective=elec,
+            req_total=total,
+        )
     
-    if result.empty:
-        result = gr_df[
-            (gr_df['전공명'] == multi_major) &
-            (gr_df['제도유형'] == program_type)
-        ]
-        if not result.empty:
-            closest_year = min(result['기준학번'].unique(), key=lambda x: abs(x - admission_year))
-            result = result[result['기준학번'] == closest_year]
+    return record
+
+
+def _build_graduation_requirement(row, admission_year: int) -> GraduationRequirement:
+    """다전공 기준 행(Series 또는 dict) → 기준 레코드
     
-    if result.empty:
-        # 기본값 반환
-        defaults = {
-            "복수전공": (15, 21, 36),
-            "부전공": (6, 15, 21),
-            "융합전공": (15, 21, 36),
-            "융합부전공": (6, 15, 21),
-        }
-        req, elec, total = defaults.get(program_type, (15, 21, 36))
-        return {
-            'major_name': multi_major,
-            'program_type': program_type,
-            'admission_year': admission_year,
-            'req_multi_required': req,
-            'req_multi_elective': elec,
-            'req_total': total,
-        }
-    
-    row = result.iloc[0]
-    return {
-        'major_name': row['전공명'],
-        'program_type': row['제도유형'],
-        'admission_year': safe_int(row['기준학번'], admission_year),
-        'req_multi_required': safe_int(row['다전공_전공필수'], 15),
-        'req_multi_elective': safe_int(row['다전공_전공선택'], 21),
-        'req_total': safe_int(row['다전공_계'], 36),
-    }
+    정수 컬럼은 load_graduation_requirements에서 이미 변환됨 (GRADUATION_REQUIREMENT_COLUMNS)
+    """
+    return GraduationRequirement(
+        major_name=row['전공명'],
+        program_type=row['제도유형'],
+        admission_year=safe_int(row['기준학번'], admission_year),
+        req_multi_required=int(row['다전공_전공필수']),
+        req_multi_elective=int(row['다전공_전공선택']),
+        req_total=int(row['다전공_계']),
+    )
 
 
 # ============================================================
 # 계산 함수
 # ============================================================
+# 정수/문자열 인자만 받는 순수 함수는 lru_cache로 같은 인자의 재계산을 생략
 
+@lru_cache(maxsize=16)
 def get_total_semesters(admission_type: str) -> int:
     """총 학기 수 계산"""
-    if admission_type == "신입학":
-        return FRESHMAN_TOTAL_SEMESTERS
-    else:
-        return TRANSFER_TOTAL_SEMESTERS
+    return TOTAL_SEMESTERS_BY_ADMISSION.get(admission_type, TRANSFER_TOTAL_SEMESTERS)
 
 
+@lru_cache(maxsize=64)
 def calculate_remaining_semesters(admission_type: str, completed_semesters: int) -> int:
     """남은 학기 계산"""
     total = get_total_semesters(admission_type)
     return max(0, total - completed_semesters)
 
 
+@lru_cache(maxsize=64)
 def calculate_max_additional_credits(remaining_semesters: int) -> int:
     """최대 추가 이수 가능 학점"""
     return remaining_semesters * MAX_CREDITS_PER_SEMESTER
 
 
-def apply_excess_to_elective(
-    completed_required: int,
-    req_required: int,
-    completed_elective: int
-) -> Tuple[int, int]:
-    """전공필수 초과분 → 전공선택 이월"""
-    if completed_required > req_required:
-        excess = completed_required - req_required
-        return req_required, completed_elective + excess
-    return completed_required, completed_elective
-
-
+@lru_cache(maxsize=256)
 def calculate_deficit(completed: int, required: int) -> int:
     """부족 학점 계산"""
     return max(0, required - completed)
 
 
+def compute_deficits(
+    completed_major_required: int,
+    completed_major_elective: int,
+    completed_basic_literacy: int,
+    completed_basic_science: int,
+    completed_core_liberal: int,
+    completed_total: int,
+    req_major_required: int,
+    req_major_elective: int,
+    req_basic_literacy: int,
+    req_basic_science: int,
+    req_core_liberal: int,
+    req_graduation_credits: int
+) -> Tuple[int, int, int, int, int, int]:
+    """부족 학점 계산 (정수 연산만 수행)
+    
+    반환: (전공필수, 전공선택, 기초문해, 기초과학, 핵심교양, 졸업학점) 부족분
+    """
+    # 전공필수 초과분 → 전공선택 이월 (음수면 전공필수 부족분)
+    excess_required = completed_major_required - req_major_required
+    
+    return (
+        max(0, -excess_required),
+        max(0, req_major_elective - completed_major_elective - max(0, excess_required)),
+        max(0, req_basic_literacy - completed_basic_literacy),
+        max(0, req_basic_science - completed_basic_science),
+        max(0, req_core_liberal - completed_core_liberal),
+        max(0, req_graduation_credits - completed_total),
+    )
+
+
+def apply_deficits(analysis: CreditAnalysis) -> None:
+    """CreditAnalysis의 이수/기준 학점으로 부족 학점 필드 채우기"""
+    (
+        analysis.deficit_major_required,
+        analysis.deficit_major_elective,
+        analysis.deficit_basic_literacy,
+        analysis.deficit_basic_science,
+        analysis.deficit_core_liberal,
+        analysis.deficit_graduation,
+    ) = compute_deficits(
+        analysis.completed_major_required,
+        analysis.completed_major_elective,
+        analysis.completed_basic_literacy,
+        analysis.completed_basic_science,
+        analysis.completed_core_liberal,
+        analysis.completed_total,
+        analysis.req_major_required,
+        analysis.req_major_elective,
+        analysis.req_basic_literacy,
+        analysis.req_basic_science,
+        analysis.req_core_liberal,
+        analysis.req_graduation_credits,
+    )
+
+
+@lru_cache(maxsize=256)
 def calculate_graduation_credits(
     program_type: str,
     primary_grad_credits: int,
-    multi_grad_credits: int,
+    multi_total_credits: int,
     multi_major_name: str = ""
 ) -> int:
-    """제도별 졸업학점 계산"""
-    if program_type == "복수전공":
-        # 건축학전공(5년제)는 164학점
-        if multi_major_name == "건축학전공(5년제)":
-            return min(max(primary_grad_credits, multi_grad_credits), 164)
-        # 일반 복수전공은 최대 130학점
-        return min(max(primary_grad_credits, multi_grad_credits), MAX_DOUBLE_MAJOR_CREDITS)
-    else:
+    """제도별 졸업학점 계산
+    
+    multi_total_credits: 다전공 기준의 다전공 계 (기준이 없으면 0)
+    """
+    if program_type != "복수전공":
         return primary_grad_credits
+    # 복수전공 졸업학점 = 본전공 졸업학점 + 다전공 계
+    # 일반 복수전공은 최대 130학점 (건축학전공(5년제)는 164학점)
+    cap = DOUBLE_MAJOR_CREDIT_CAPS.get(multi_major_name, MAX_DOUBLE_MAJOR_CREDITS)
+    return min(primary_grad_credits + max(0, multi_total_credits), cap)
 
 
+@lru_cache(maxsize=512)
 def determine_graduation_status(
     deficit_total: int,
     max_additional: int,
@@ -442,86 +898,38 @@ def determine_graduation_status(
     deficit_multi_required: int,
     remaining_semesters: int
 ) -> Tuple[str, bool]:
-    """이수 가능 상태 판단"""
+    """이수 가능 상태 판단 (필수 과목 부족분은 deficit_total에 포함되어 있음)"""
     if deficit_total <= 0:
         return "가능", True
     
-    if deficit_total > max_additional:
-        return "어려움", False
-    
-    # 필수 과목 이수 가능 여부
-    total_required_deficit = deficit_major_required + deficit_multi_required
-    
-    # 여유도 계산
+    # 여유도 계산 (음수이면 남은 학기에 이수 불가)
     margin = max_additional - deficit_total
+    if margin < 0:
+        return "어려움", False
     
     if margin >= remaining_semesters * 6:  # 학기당 6학점 이상 여유
         return "가능", True
-    elif margin >= 0:
-        return "위험", True
-    else:
-        return "어려움", False
+    return "위험", True
 
 
 # ============================================================
 # 분석 함수
 # ============================================================
 
-def analyze_current_status(student: StudentInput, pr_df: pd.DataFrame) -> CreditAnalysis:
-    """현재 상태 분석 (본전공 기준, 다전공 미참여 시)"""
-    analysis = CreditAnalysis()
+def compute_base_analysis(student: StudentInput) -> CreditAnalysis:
+    """학생 입력만으로 정해지는 공통 항목 계산 (남은 학기, 이수 학점, 총 이수 학점)
     
+    run_simulation에서 학생당 1회 계산해 현재 상태/제도별 분석이 공유
+    """
     # 남은 학기 계산
-    analysis.remaining_semesters = calculate_remaining_semesters(
+    remaining_semesters = calculate_remaining_semesters(
         student.admission_type,
         student.completed_semesters
     )
-    analysis.max_additional_credits = calculate_max_additional_credits(analysis.remaining_semesters)
-    
-    # 본전공 기준 조회 (복수전공 기준으로 조회)
-    pr_req = get_primary_requirement(student.primary_major, "복수전공", student.admission_year, pr_df)
-    
-    if pr_req:
-        analysis.req_major_required = pr_req['req_major_required']
-        analysis.req_major_elective = pr_req['req_major_elective']
-        # 교양 기준 (None이면 0으로 설정)
-        analysis.req_basic_literacy = pr_req['req_basic_literacy'] if pr_req['req_basic_literacy'] is not None else 0
-        analysis.req_basic_science = pr_req['req_basic_science'] if pr_req['req_basic_science'] is not None else 0
-        analysis.req_core_liberal = pr_req['req_core_liberal'] if pr_req['req_core_liberal'] is not None else 0
-        analysis.req_graduation_credits = pr_req['req_graduation_credits']
-    else:
-        # 데이터를 찾지 못한 경우 기본값
-        analysis.req_major_required = 15
-        analysis.req_major_elective = 33
-        analysis.req_basic_literacy = 0
-        analysis.req_basic_science = 0
-        analysis.req_core_liberal = 0
-        analysis.req_graduation_credits = DEFAULT_GRADUATION_CREDITS
-    
-    # 이수 학점
-    analysis.completed_major_required = student.credits_major_required
-    analysis.completed_major_elective = student.credits_major_elective
-    analysis.completed_basic_literacy = student.credits_basic_literacy
-    analysis.completed_basic_science = student.credits_basic_science
-    analysis.completed_core_liberal = student.credits_core_liberal
-    
-    # 전공필수 초과분 이월
-    adj_required, adj_elective = apply_excess_to_elective(
-        analysis.completed_major_required,
-        analysis.req_major_required,
-        analysis.completed_major_elective
-    )
-    
-    # 부족 학점
-    analysis.deficit_major_required = calculate_deficit(adj_required, analysis.req_major_required)
-    analysis.deficit_major_elective = calculate_deficit(adj_elective, analysis.req_major_elective)
-    analysis.deficit_basic_literacy = calculate_deficit(student.credits_basic_literacy, analysis.req_basic_literacy)
-    analysis.deficit_basic_science = calculate_deficit(student.credits_basic_science, analysis.req_basic_science)
-    analysis.deficit_core_liberal = calculate_deficit(student.credits_core_liberal, analysis.req_core_liberal)
     
-    # 총 이수 학점
+    # 총 이수 학점 (편입학은 인정학점 + 전공/자유 학점)
     if student.admission_type == "신입학":
-        analysis.completed_total = (
+        completed_total = (
             student.credits_basic_literacy +
             student.credits_basic_science +
             student.credits_core_liberal +
@@ -530,183 +938,340 @@ def analyze_current_status(student: StudentInput, pr_df: pd.DataFrame) -> Credit
             student.credits_free
         )
     else:
-        analysis.completed_total = (
+        completed_total = (
             student.transfer_credits +
             student.credits_major_required +
             student.credits_major_elective +
             student.credits_free
         )
     
-    # 졸업학점 부족분
-    analysis.deficit_graduation = calculate_deficit(
-        analysis.completed_total,
-        analysis.req_graduation_credits
+    return CreditAnalysis(
+        remaining_semesters=remaining_semesters,
+        max_additional_credits=calculate_max_additional_credits(remaining_semesters),
+        # 이수 학점
+        completed_major_required=student.credits_major_required,
+        completed_major_elective=student.credits_major_elective,
+        completed_basic_literacy=student.credits_basic_literacy,
+        completed_basic_science=student.credits_basic_science,
+        completed_core_liberal=student.credits_core_liberal,
+        completed_total=completed_total,
     )
+
+
+def analyze_current_status(
+    student: StudentInput,
+    pr_df: pd.DataFrame,
+    pr_index: Optional[RequirementIndex] = None,
+    base: Optional[CreditAnalysis] = None
+) -> CreditAnalysis:
+    """현재 상태 분석 (본전공 기준, 다전공 미참여 시)"""
+    # 본전공 기준 조회 (복수전공 기준으로 조회)
+    pr_req = get_primary_requirement(student.primary_major, "복수전공", student.admission_year, pr_df, pr_index)
+    
+    if pr_req:
+        requirements = dict(
+            req_major_required=pr_req.req_major_required,
+            req_major_elective=pr_req.req_major_elective,
+            # 교양 기준 (None이면 0으로 설정)
+            req_basic_literacy=pr_req.req_basic_literacy if pr_req.req_basic_literacy is not None else 0,
+            req_basic_science=pr_req.req_basic_science if pr_req.req_basic_science is not None else 0,
+            req_core_liberal=pr_req.req_core_liberal if pr_req.req_core_liberal is not None else 0,
+            req_graduation_credits=pr_req.req_graduation_credits,
+        )
+    else:
+        # 데이터를 찾지 못한 경우 기본값
+        requirements = dict(
+            req_major_required=15,
+            req_major_elective=33,
+            req_basic_literacy=0,
+            req_basic_science=0,
+            req_core_liberal=0,
+            req_graduation_credits=DEFAULT_GRADUATION_CREDITS,
+        )
+    
+    # 학생 입력 기반 공통 항목(남은 학기, 이수 학점)에 본전공 기준을 한 번에 반영
+    analysis = replace(base if base is not None else compute_base_analysis(student), **requirements)
+    
+    # 부족 학점
+    apply_deficits(analysis)
+    analysis.total_deficit = analysis.deficit_major_required + analysis.deficit_major_elective
     
     return analysis
 
 
+def analyze_current_status_batch(
+    students: List[StudentInput],
+    pr_df: pd.DataFrame,
+    pr_index: Optional[RequirementIndex] = None
+) -> pd.DataFrame:
+    """여러 학생의 현재 상태 일괄 분석 (analyze_current_status의 벡터화 버전)
+    
+    학생 1명당 1행, 컬럼은 CreditAnalysis 필드명과 동일
+    """
+    columns = [f.name for f in fields(CreditAnalysis)]
+    if not students:
+        return pd.DataFrame(columns=columns)
+    
+    # 학생 × 영역 이수 학점 행렬 (열 순서: _STUDENT_CREDITS)
+    credits = np.array([_STUDENT_CREDITS(s) for s in students], dtype=np.int64)
+    literacy, science, core, major_required, major_elective, free = credits[:, :6].T
+    keys = [(s.primary_major, s.admission_year) for s in students]
+    
+    # 본전공 기준 조회 (전공명, 입학연도 조합별 1회만 조회)
+    # 열 순서는 compute_deficits와 같음 (전공필수, 전공선택, 기초문해, 기초과학, 핵심교양, 졸업학점)
+    # 인덱스가 없으면 조합마다 DataFrame을 다시 훑지 않도록 한 번만 생성
+    if pr_index is None:
+        pr_index = build_requirement_index(pr_df, _build_primary_requirement)
+    req_by_key = {}
+    for key in set(keys):
+        pr_req = get_primary_requirement(key[0], "복수전공", key[1], pr_df, pr_index)
+        if pr_req:
+            req_by_key[key] = (
+                pr_req.req_major_required,
+                pr_req.req_major_elective,
+                pr_req.req_basic_literacy if pr_req.req_basic_literacy is not None else 0,
+                pr_req.req_basic_science if pr_req.req_basic_science is not None else 0,
+                pr_req.req_core_liberal if pr_req.req_core_liberal is not None else 0,
+                pr_req.req_graduation_credits,
+            )
+        else:
+            req_by_key[key] = (15, 33, 0, 0, 0, DEFAULT_GRADUATION_CREDITS)
+    reqs = np.array([req_by_key[key] for key in keys], dtype=np.int64)
+    req_major_required, req_major_elective, req_basic_literacy, req_basic_science, req_core_liberal, req_graduation = reqs.T
+    
+    is_freshman = np.array([s.admission_type == "신입학" for s in students])
+    completed_semesters = np.array([s.completed_semesters for s in students], dtype=np.int64)
+    transfer = np.array([s.transfer_credits for s in students], dtype=np.int64)
+    
+    # 남은 학기
+    total_semesters = np.where(is_freshman, FRESHMAN_TOTAL_SEMESTERS, TRANSFER_TOTAL_SEMESTERS)
+    remaining_semesters = np.maximum(0, total_semesters - completed_semesters)
+    
+    # 전공필수 초과분 이월
+    adj_required = np.minimum(major_required, req_major_required)
+    adj_elective = major_elective + np.maximum(0, major_required - req_major_required)
+    
+    # 총 이수 학점
+    completed_total = np.where(
+        is_freshman,
+        literacy + science + core + major_required + major_elective + free,
+        transfer + major_required + major_elective + free
+    )
+    
+    # 부족 학점 (기준 행렬과 같은 열 순서의 이수 행렬로 한 번에 계산)
+    completed = np.column_stack((adj_required, adj_elective, literacy, science, core, completed_total))
+    (
+        deficit_major_required,
+        deficit_major_elective,
+        deficit_basic_literacy,
+        deficit_basic_science,
+        deficit_core_liberal,
+        deficit_graduation,
+    ) = np.maximum(0, reqs - completed).T
+    
+    result = pd.DataFrame({
+        'req_major_required': req_major_required,
+        'req_major_elective': req_major_elective,
+        'req_graduation_credits': req_graduation,
+        'req_basic_literacy': req_basic_literacy,
+        'req_basic_science': req_basic_science,
+        'req_core_liberal': req_core_liberal,
+        'completed_major_required': major_required,
+        'completed_major_elective': major_elective,
+        'completed_total': completed_total,
+        'completed_basic_literacy': literacy,
+        'completed_basic_science': science,
+        'completed_core_liberal': core,
+        'deficit_major_required': deficit_major_required,
+        'deficit_major_elective': deficit_major_elective,
+        'total_deficit': deficit_major_required + deficit_major_elective,
+        'deficit_graduation': deficit_graduation,
+        'deficit_basic_literacy': deficit_basic_literacy,
+        'deficit_basic_science': deficit_basic_science,
+        'deficit_core_liberal': deficit_core_liberal,
+        'remaining_semesters': remaining_semesters,
+        'max_additional_credits': remaining_semesters * MAX_CREDITS_PER_SEMESTER,
+    })
+    
+    # CreditAnalysis 필드 순서로 정렬 (다전공 항목은 0)
+    return result.reindex(columns=columns, fill_value=0)
+
+
 def simulate_program(
     student: StudentInput,
     program_type: str,
     multi_major: str,
     pr_df: pd.DataFrame,
-    gr_df: pd.DataFrame
+    gr_df: pd.DataFrame,
+    pr_index: Optional[RequirementIndex] = None,
+    gr_index: Optional[RequirementIndex] = None,
+    base: Optional[CreditAnalysis] = None,
+    completed_multi: Optional[Tuple[int, int]] = None
 ) -> SimulationResult:
-    """단일 제도 분석"""
-    result = SimulationResult(
-        program_type=program_type,
-        multi_major_name=multi_major
-    )
-    
-    analysis = CreditAnalysis()
-    
-    # 남은 학기
-    analysis.remaining_semesters = calculate_remaining_semesters(
-        student.admission_type,
-        student.completed_semesters
-    )
-    analysis.max_additional_credits = calculate_max_additional_credits(analysis.remaining_semesters)
+    """단일 제도 분석
     
+    completed_multi: 기존 참여자의 다전공 (전공필수, 전공선택) 이수 학점 (신규 신청자는 None)
+    """
     # 본전공 기준 (다전공 참여 시 변화된 기준)
-    pr_req = get_primary_requirement(student.primary_major, program_type, student.admission_year, pr_df)
+    pr_req = get_primary_requirement(student.primary_major, program_type, student.admission_year, pr_df, pr_index)
     
     if pr_req:
         # 다전공 참여 시 변화된 본전공 학점 사용
-        analysis.req_major_required = pr_req['req_major_required_changed']
-        analysis.req_major_elective = pr_req['req_major_elective_changed']
-        analysis.req_major_required_changed = pr_req['req_major_required_changed']
-        analysis.req_major_elective_changed = pr_req['req_major_elective_changed']
+        req_major_required = pr_req.req_major_required_changed
+        req_major_elective = pr_req.req_major_elective_changed
         # 교양 기준 (None이면 0으로 설정)
-        analysis.req_basic_literacy = pr_req['req_basic_literacy'] if pr_req['req_basic_literacy'] is not None else 0
-        analysis.req_basic_science = pr_req['req_basic_science'] if pr_req['req_basic_science'] is not None else 0
-        analysis.req_core_liberal = pr_req['req_core_liberal'] if pr_req['req_core_liberal'] is not None else 0
+        req_basic_literacy = pr_req.req_basic_literacy if pr_req.req_basic_literacy is not None else 0
+        req_basic_science = pr_req.req_basic_science if pr_req.req_basic_science is not None else 0
+        req_core_liberal = pr_req.req_core_liberal if pr_req.req_core_liberal is not None else 0
     else:
-        analysis.req_major_required = 15
-        analysis.req_major_elective = 33
-        analysis.req_major_required_changed = 15
-        analysis.req_major_elective_changed = 33
-        analysis.req_basic_literacy = 0
-        analysis.req_basic_science = 0
-        analysis.req_core_liberal = 0
+        req_major_required, req_major_elective = 15, 33
+        req_basic_literacy = req_basic_science = req_core_liberal = 0
     
     # 다전공 기준
-    gr_req = get_graduation_requirement(multi_major, program_type, student.admission_year, gr_df)
+    gr_req = get_graduation_requirement(multi_major, program_type, student.admission_year, gr_df, gr_index)
     
     if gr_req:
-        analysis.req_multi_required = gr_req['req_multi_required']
-        analysis.req_multi_elective = gr_req['req_multi_elective']
+        req_multi_required = gr_req.req_multi_required
+        req_multi_elective = gr_req.req_multi_elective
     else:
         # 기본값
-        if program_type == "복수전공":
-            analysis.req_multi_required = 15
-            analysis.req_multi_elective = 21
-        elif program_type == "부전공":
-            analysis.req_multi_required = 6
-            analysis.req_multi_elective = 15
-        elif program_type == "융합전공":
-            analysis.req_multi_required = 15
-            analysis.req_multi_elective = 21
-        else:
-            analysis.req_multi_required = 6
-            analysis.req_multi_elective = 15
-    
-    # 졸업학점 계산
-    analysis.req_graduation_credits = calculate_graduation_credits(
-        program_type,
-        DEFAULT_GRADUATION_CREDITS,
-        gr_req['req_total'] + DEFAULT_GRADUATION_CREDITS if gr_req else DEFAULT_GRADUATION_CREDITS,
-        multi_major
-    )
-    
-    # 이수 학점
-    analysis.completed_major_required = student.credits_major_required
-    analysis.completed_major_elective = student.credits_major_elective
-    analysis.completed_multi_required = 0  # 신규 신청자는 0
-    analysis.completed_multi_elective = 0
-    
-    # 전공필수 초과분 이월
-    adj_required, adj_elective = apply_excess_to_elective(
-        analysis.completed_major_required,
-        analysis.req_major_required,
-        analysis.completed_major_elective
-    )
-    
-    # 부족 학점
-    analysis.deficit_major_required = calculate_deficit(adj_required, analysis.req_major_required)
-    analysis.deficit_major_elective = calculate_deficit(adj_elective, analysis.req_major_elective)
-    analysis.deficit_multi_required = analysis.req_multi_required
-    analysis.deficit_multi_elective = analysis.req_multi_elective
-    
-    # 교양 부족 학점 계산 추가
-    analysis.deficit_basic_literacy = calculate_deficit(student.credits_basic_literacy, analysis.req_basic_literacy)
-    analysis.deficit_basic_science = calculate_deficit(student.credits_basic_science, analysis.req_basic_science)
-    analysis.deficit_core_liberal = calculate_deficit(student.credits_core_liberal, analysis.req_core_liberal)
-    
-    # 교양 이수 학점 기록
-    analysis.completed_basic_literacy = student.credits_basic_literacy
-    analysis.completed_basic_science = student.credits_basic_science
-    analysis.completed_core_liberal = student.credits_core_liberal
-    
-    # 총 이수 학점
-    if student.admission_type == "신입학":
-        analysis.completed_total = (
-            student.credits_basic_literacy +
-            student.credits_basic_science +
-            student.credits_core_liberal +
-            student.credits_major_required +
-            student.credits_major_elective +
-            student.credits_free
-        )
-    else:
-        analysis.completed_total = (
-            student.transfer_credits +
-            student.credits_major_required +
-            student.credits_major_elective +
-            student.credits_free
+        req_multi_required, req_multi_elective = DEFAULT_MULTI_REQUIREMENTS.get(
+            program_type, DEFAULT_MULTI_REQUIREMENT_OTHER
         )
     
-    # 졸업학점 부족분
-    total_required = (
-        analysis.req_major_required +
-        analysis.req_major_elective +
-        analysis.req_multi_required +
-        analysis.req_multi_elective
+    if completed_multi is None:
+        # 신규 신청자: 다전공 이수 학점 0, 기준 전체가 부족분
+        completed_multi_required = completed_multi_elective = 0
+        deficit_multi_required, deficit_multi_elective = req_multi_required, req_multi_elective
+    else:
+        completed_multi_required, completed_multi_elective = completed_multi
+        deficit_multi_required = calculate_deficit(completed_multi_required, req_multi_required)
+        deficit_multi_elective = calculate_deficit(completed_multi_elective, req_multi_elective)
+    
+    # 학생 입력 기반 공통 항목(남은 학기, 이수 학점)에 제도별 기준을 한 번에 반영
+    if base is None:
+        base = compute_base_analysis(student)
+    analysis = replace(
+        base,
+        req_major_required=req_major_required,
+        req_major_elective=req_major_elective,
+        req_major_required_changed=req_major_required,
+        req_major_elective_changed=req_major_elective,
+        req_basic_literacy=req_basic_literacy,
+        req_basic_science=req_basic_science,
+        req_core_liberal=req_core_liberal,
+        req_multi_required=req_multi_required,
+        req_multi_elective=req_multi_elective,
+        # 다전공 이수 학점 (총 이수 학점에도 합산)
+        completed_multi_required=completed_multi_required,
+        completed_multi_elective=completed_multi_elective,
+        deficit_multi_required=deficit_multi_required,
+        deficit_multi_elective=deficit_multi_elective,
+        completed_total=base.completed_total + completed_multi_required + completed_multi_elective,
+        # 졸업학점 계산
+        req_graduation_credits=calculate_graduation_credits(
+            program_type,
+            DEFAULT_GRADUATION_CREDITS,
+            gr_req.req_total if gr_req else 0,
+            multi_major
+        ),
     )
     
+    # 부족 학점 (본전공, 교양, 졸업학점)
+    apply_deficits(analysis)
+    
     # 실제 부족 학점 계산
-    total_deficit = (
+    analysis.total_deficit = (
         analysis.deficit_major_required +
         analysis.deficit_major_elective +
         analysis.deficit_multi_required +
         analysis.deficit_multi_elective
     )
     
-    analysis.deficit_graduation = calculate_deficit(
-        analysis.completed_total,
-        analysis.req_graduation_credits
-    )
-    
-    # 이수 가능 여부 판단
+    # 이수 가능 여부 판단 (다전공 이수 학점과 관계없이 다전공 기준 전체를 부족분으로 판단)
     status, can_grad = determine_graduation_status(
-        total_deficit,
+        analysis.deficit_major_required + analysis.deficit_major_elective + req_multi_required + req_multi_elective,
         analysis.max_additional_credits,
         analysis.deficit_major_required,
-        analysis.deficit_multi_required,
+        req_multi_required,
         analysis.remaining_semesters
     )
     
-    result.graduation_status = status
-    result.can_graduate = can_grad
-    result.credit_analysis = analysis
+    # 학기별 이수 계획은 외부에서 생성 (simulate_program_with_plan)
+    return SimulationResult(
+        program_type=program_type,
+        multi_major_name=multi_major,
+        graduation_status=status,
+        can_graduate=can_grad,
+        credit_analysis=analysis,
+    )
+
+
+def _spread_credits(total: int, semester_count: int) -> List[int]:
+    """학점을 학기 수만큼 고르게 분배 (나머지는 앞 학기부터 1학점씩)"""
+    if semester_count <= 0:
+        return []
+    base, extra = divmod(total, semester_count)
+    return [base + 1] * extra + [base] * (semester_count - extra)
+
+
+@lru_cache(maxsize=256)
+def _allocate_semester_credits(
+    deficits: Tuple[int, ...],
+    grades: Tuple[int, ...],
+    total_deficit: int
+) -> Tuple[Tuple[int, ...], ...]:
+    """학기별 학점 배정 (정수 연산만 수행, 같은 입력은 캐시 재사용)
+    
+    deficits: PLAN_ITEMS 순서의 항목별 부족 학점
+    grades: 남은 각 학기의 학년
+    반환값: 학기별 (PLAN_ITEMS 순서의 배정 학점..., 합계)
+    """
+    remaining = list(deficits)
+    
+    # 전체 남은 학점 추적 (total_deficit을 초과하지 않도록)
+    total_remaining = total_deficit
+    semester_count = len(grades)
+    rows = []
     
-    # 학기별 이수 계획은 외부에서 생성하도록 변경
-    # result.semester_plan = generate_semester_plan(analysis, student)
+    # 학기별 목표 학점 (남은 학점을 남은 학기에 고르게 분배)
+    quotas = _spread_credits(total_remaining, semester_count)
     
-    return result
+    for sem_idx, grade in enumerate(grades):
+        # 이번 학기에 배정할 학점 (최대 18학점)
+        quota = quotas[sem_idx]
+        remaining_credits = min(MAX_CREDITS_PER_SEMESTER, quota)
+        
+        row = [0] * len(PLAN_ITEMS)
+        
+        # 우선순위에 따른 학점 배정
+        # 1학년: 교양 우선, 4학년: 교양 우선
+        # 2-3학년: 전공 우선
+        # 자유학점은 free_deficit이 있을 때만 배정 (우선순위 마지막)
+        order = _LIBERAL_FIRST_ORDER if grade == 1 or grade == 4 else _MAJOR_FIRST_ORDER
+        for idx, cap in order:
+            if remaining_credits <= 0:
+                break
+            if remaining[idx] <= 0:
+                continue
+            take = min(remaining[idx], remaining_credits, cap or remaining_credits)
+            row[idx] = take
+            remaining[idx] -= take
+            remaining_credits -= take
+        
+        # 전체 남은 학점 감소
+        allocated = sum(row)
+        total_remaining -= allocated
+        rows.append((*row, allocated))
+        
+        # 목표보다 적게 배정된 경우 남은 학기의 목표 재분배
+        if allocated < quota:
+            quotas[sem_idx + 1:] = _spread_credits(total_remaining, semester_count - sem_idx - 1)
+    
+    return tuple(rows)
 
 
-def generate_semester_plan(analysis: CreditAnalysis, student: StudentInput) -> List[Dict]:
+def generate_semester_plan(analysis: CreditAnalysis, student: StudentInput) -> List[SemesterPlan]:
     """학기별 이수 계획 생성 - 학년/학기 표기 및 우선순위 반영"""
     plan = []
     
@@ -718,12 +1283,9 @@ def generate_semester_plan(analysis: CreditAnalysis, student: StudentInput) -> L
     deficit_basic_science = analysis.deficit_basic_science
     deficit_core_liberal = analysis.deficit_core_liberal
     
-    # 남은 필수 이수학점 = 본전공 부족 + 다전공 부족 (교양 포함)
+    # 남은 필수 이수학점 = 본전공 부족 + 다전공 부족 (total_deficit) + 교양 부족
     required_deficit = (
-        analysis.deficit_major_required +
-        analysis.deficit_major_elective +
-        analysis.deficit_multi_required +
-        analysis.deficit_multi_elective +
+        analysis.total_deficit +
         deficit_basic_literacy +
         deficit_basic_science +
         deficit_core_liberal
@@ -735,6 +1297,10 @@ def generate_semester_plan(analysis: CreditAnalysis, student: StudentInput) -> L
     # 두 값 중 큰 값을 기준으로 학기별 계획 수립
     total_deficit = max(required_deficit, graduation_deficit)
     
+    # 부족 학점이 없으면 배정할 학기도 없음
+    if total_deficit <= 0:
+        return plan
+    
     # 자유학점 계산
     # - 총 이수학점 대비 부족학점 > 남은 필수 이수학점: 차이만큼 자유학점 배정
     # - 남은 필수 이수학점 >= 총 이수학점 대비 부족학점: 자유학점 배정 없음
@@ -744,266 +1310,95 @@ def generate_semester_plan(analysis: CreditAnalysis, student: StudentInput) -> L
         free_deficit = 0
     
     # 현재 학기 계산 (신입학: 8학기, 편입학: 4학기)
-    total_semesters = 8 if student.admission_type == "신입학" else 4
     current_semester = student.completed_semesters
     
-    remaining_major_req = analysis.deficit_major_required
-    remaining_major_elec = analysis.deficit_major_elective
-    remaining_multi_req = analysis.deficit_multi_required
-    remaining_multi_elec = analysis.deficit_multi_elective
-    remaining_basic_literacy = deficit_basic_literacy
-    remaining_basic_science = deficit_basic_science
-    remaining_core_liberal = deficit_core_liberal
-    remaining_free = free_deficit
+    # 남은 각 학기의 학년/학기 표기
+    # 신입학: 1학기=1-1, 2학기=1-2, 3학기=2-1, ...
+    # 편입학: 1학기=3-1, 2학기=3-2, 3학기=4-1, 4학기=4-2
+    schedule = FRESHMAN_SEMESTER_SCHEDULE if student.admission_type == "신입학" else TRANSFER_SEMESTER_SCHEDULE
+    upcoming = schedule[current_semester:current_semester + analysis.remaining_semesters]
+    grades = tuple(grade for grade, _ in upcoming)
+    labels = [label for _, label in upcoming]
+    
+    # 항목별 부족 학점 (PLAN_ITEMS 순서)
+    deficits = (
+        deficit_basic_literacy,
+        deficit_basic_science,
+        deficit_core_liberal,
+        analysis.deficit_major_required,
+        analysis.deficit_major_elective,
+        analysis.deficit_multi_required,
+        analysis.deficit_multi_elective,
+        free_deficit,
+    )
     
-    # 전체 남은 학점 추적 (total_deficit을 초과하지 않도록)
-    total_remaining = total_deficit
+    rows = _allocate_semester_credits(deficits, grades, total_deficit)
     
-    for sem_idx in range(1, analysis.remaining_semesters + 1):
-        # 학년/학기 계산
-        absolute_semester = current_semester + sem_idx
-        if student.admission_type == "신입학":
-            # 신입학: 1학기=1-1, 2학기=1-2, 3학기=2-1, ...
-            grade = (absolute_semester + 1) // 2
-            semester = 1 if absolute_semester % 2 == 1 else 2
-        else:
-            # 편입학: 3학년 편입
-            # absolute_semester: 1학기=3-1, 2학기=3-2, 3학기=4-1, 4학기=4-2
-            grade = 3 + (absolute_semester - 1) // 2
-            semester = 1 if absolute_semester % 2 == 1 else 2
-        
-        sem_plan = {
-            "semester": f"{grade}학년 {semester}학기",
-            "basic_literacy": 0,
-            "basic_science": 0,
-            "core_liberal": 0,
-            "major_required": 0,
-            "major_elective": 0,
-            "multi_required": 0,
-            "multi_elective": 0,
-            "free": 0,
-            "total": 0
-        }
-        
-        # 남은 학기 수
-        remaining_semesters_count = analysis.remaining_semesters - sem_idx + 1
-        
-        # 이번 학기에 배정할 학점 (최대 18학점, 남은 전체 학점 고려)
-        credits_this_semester = min(
-            MAX_CREDITS_PER_SEMESTER,
-            (total_remaining + remaining_semesters_count - 1) // remaining_semesters_count,
-            total_remaining  # 남은 전체 학점을 초과하지 않음
-        )
-        
-        remaining_credits = credits_this_semester
-        
-        # 우선순위에 따른 학점 배정
-        # 1학년: 교양 우선, 4학년: 교양 우선
-        # 2-3학년: 전공 우선
-        
-        if grade == 1 or grade == 4:
-            # 1학년, 4학년: 교양 우선
-            # 기초교양(기초문해)
-            if remaining_basic_literacy > 0 and remaining_credits > 0:
-                take = min(remaining_basic_literacy, remaining_credits)
-                sem_plan["basic_literacy"] = take
-                remaining_basic_literacy -= take
-                remaining_credits -= take
-            
-            # 기초교양(기초과학)
-            if remaining_basic_science > 0 and remaining_credits > 0:
-                take = min(remaining_basic_science, remaining_credits)
-                sem_plan["basic_science"] = take
-                remaining_basic_science -= take
-                remaining_credits -= take
-            
-            # 핵심교양
-            if remaining_core_liberal > 0 and remaining_credits > 0:
-                take = min(remaining_core_liberal, remaining_credits)
-                sem_plan["core_liberal"] = take
-                remaining_core_liberal -= take
-                remaining_credits -= take
-            
-            # 전공필수
-            if remaining_major_req > 0 and remaining_credits > 0:
-                take = min(remaining_major_req, remaining_credits, 6)
-                sem_plan["major_required"] = take
-                remaining_major_req -= take
-                remaining_credits -= take
-            
-            if remaining_multi_req > 0 and remaining_credits > 0:
-                take = min(remaining_multi_req, remaining_credits, 6)
-                sem_plan["multi_required"] = take
-                remaining_multi_req -= take
-                remaining_credits -= take
-            
-            # 전공선택
-            if remaining_major_elec > 0 and remaining_credits > 0:
-                take = min(remaining_major_elec, remaining_credits)
-                sem_plan["major_elective"] = take
-                remaining_major_elec -= take
-                remaining_credits -= take
-            
-            if remaining_multi_elec > 0 and remaining_credits > 0:
-                take = min(remaining_multi_elec, remaining_credits)
-                sem_plan["multi_elective"] = take
-                remaining_multi_elec -= take
-                remaining_credits -= take
-            
-            # 자유학점은 free_deficit이 있을 때만 배정
-            if remaining_free > 0 and remaining_credits > 0:
-                take = min(remaining_free, remaining_credits)
-                sem_plan["free"] = take
-                remaining_free -= take
-                remaining_credits -= take
-                
-        else:
-            # 2-3학년: 전공 우선
-            # 전공필수
-            if remaining_major_req > 0 and remaining_credits > 0:
-                take = min(remaining_major_req, remaining_credits, 6)
-                sem_plan["major_required"] = take
-                remaining_major_req -= take
-                remaining_credits -= take
-            
-            if remaining_multi_req > 0 and remaining_credits > 0:
-                take = min(remaining_multi_req, remaining_credits, 6)
-                sem_plan["multi_required"] = take
-                remaining_multi_req -= take
-                remaining_credits -= take
-            
-            # 전공선택
-            if remaining_major_elec > 0 and remaining_credits > 0:
-                take = min(remaining_major_elec, remaining_credits)
-                sem_plan["major_elective"] = take
-                remaining_major_elec -= take
-                remaining_credits -= take
-            
-            if remaining_multi_elec > 0 and remaining_credits > 0:
-                take = min(remaining_multi_elec, remaining_credits)
-                sem_plan["multi_elective"] = take
-                remaining_multi_elec -= take
-                remaining_credits -= take
-            
-            # 기초교양(기초문해)
-            if remaining_basic_literacy > 0 and remaining_credits > 0:
-                take = min(remaining_basic_literacy, remaining_credits)
-                sem_plan["basic_literacy"] = take
-                remaining_basic_literacy -= take
-                remaining_credits -= take
-            
-            # 기초교양(기초과학)
-            if remaining_basic_science > 0 and remaining_credits > 0:
-                take = min(remaining_basic_science, remaining_credits)
-                sem_plan["basic_science"] = take
-                remaining_basic_science -= take
-                remaining_credits -= take
-            
-            # 핵심교양
-            if remaining_core_liberal > 0 and remaining_credits > 0:
-                take = min(remaining_core_liberal, remaining_credits)
-                sem_plan["core_liberal"] = take
-                remaining_core_liberal -= take
-                remaining_credits -= take
-            
-            # 자유학점은 free_deficit이 있을 때만 배정
-            if remaining_free > 0 and remaining_credits > 0:
-                take = min(remaining_free, remaining_credits)
-                sem_plan["free"] = take
-                remaining_free -= take
-                remaining_credits -= take
-        
-        sem_plan["total"] = (
-            sem_plan["major_required"] +
-            sem_plan["major_elective"] +
-            sem_plan["multi_required"] +
-            sem_plan["multi_elective"] +
-            sem_plan["basic_literacy"] +
-            sem_plan["basic_science"] +
-            sem_plan["core_liberal"] +
-            sem_plan["free"]
-        )
-        
-        # 전체 남은 학점 감소
-        total_remaining -= sem_plan["total"]
-        
-        if sem_plan["total"] > 0:
-            plan.append(sem_plan)
-    
-    return plan
+    # 합계가 0인 학기는 계획에서 제외
+    return [SemesterPlan(label, *row) for label, row in zip(labels, rows) if row[-1] > 0]
 
 
-def rank_recommendations(results: List[SimulationResult]) -> Tuple[List[SimulationResult], List[SimulationResult]]:
-    """추천 순위 정렬"""
+def simulate_program_with_plan(
+    student: StudentInput,
+    program_type: str,
+    multi_major: str,
+    pr_df: pd.DataFrame,
+    gr_df: pd.DataFrame,
+    pr_index: Optional[RequirementIndex] = None,
+    gr_index: Optional[RequirementIndex] = None,
+    base: Optional[CreditAnalysis] = None
+) -> SimulationResult:
+    """단일 제도 분석 + 학기별 이수 계획 생성 (입력은 읽기 전용)"""
+    result = simulate_program(student, program_type, multi_major, pr_df, gr_df, pr_index, gr_index, base)
+    result.semester_plan = generate_semester_plan(result.credit_analysis, student)
+    return result
+
+
+def recommendation_score(r: SimulationResult) -> Tuple[int, int, int]:
+    """추천 정렬 점수 계산 (낮을수록 좋음)"""
+    # 1. 이수 가능 여부 (가능 > 위험 > 어려움)
+    grad_score = GRADUATION_STATUS_SCORE.get(r.graduation_status, 2)
     
-    def get_score(r: SimulationResult) -> Tuple:
-        """정렬 점수 계산 (낮을수록 좋음)"""
-        # 1. 이수 가능 여부 (가능 > 위험 > 어려움)
-        grad_score = {"가능": 0, "위험": 1, "어려움": 2}.get(r.graduation_status, 2)
-        
-        # 2. 총 부족 학점 (±3학점 동일 취급을 위해 3으로 나눔)
-        total_deficit = (
-            r.credit_analysis.deficit_major_required +
-            r.credit_analysis.deficit_major_elective +
-            r.credit_analysis.deficit_multi_required +
-            r.credit_analysis.deficit_multi_elective
-        )
-        deficit_score = total_deficit // 3
-        
-        # 3. 제도 우선순위
-        priority_score = PROGRAM_PRIORITY.get(r.program_type, 5)
-        
-        return (grad_score, deficit_score, priority_score)
+    # 2. 총 부족 학점 (±3학점 동일 취급을 위해 3으로 나눔)
+    deficit_score = r.credit_analysis.total_deficit // 3
     
-    # 모든 결과를 일반 추천으로 처리
+    # 3. 제도 우선순위
+    priority_score = PROGRAM_PRIORITY.get(r.program_type, 5)
+    
+    return (grad_score, deficit_score, priority_score)
+
+
+def rank_recommendations(results: List[SimulationResult]) -> Tuple[List[SimulationResult], List[SimulationResult]]:
+    """추천 순위 정렬 (모든 결과를 일반 추천으로 처리, 보조 추천은 비어 있음)"""
     main_results = results
     supplementary = []
     
     # 정렬
-    main_results.sort(key=get_score)
+    main_results.sort(key=recommendation_score)
     
     # 순위 부여 및 추천 사유 생성
-    for idx, r in enumerate(main_results):
-        r.recommendation_rank = idx + 1
-        r.recommendation_reason = generate_recommendation_reason(r, idx + 1)
+    for rank, r in enumerate(main_results, 1):
+        r.recommendation_rank = rank
+        r.recommendation_reason = generate_recommendation_reason(r, rank)
     
     return main_results, supplementary
 
 
 def generate_recommendation_reason(result: SimulationResult, rank: int) -> str:
     """추천 사유 생성"""
-    reasons = []
-    
     analysis = result.credit_analysis
-    total_deficit = (
-        analysis.deficit_major_required +
-        analysis.deficit_major_elective +
-        analysis.deficit_multi_required +
-        analysis.deficit_multi_elective
-    )
+    total_deficit = analysis.total_deficit
     
-    if result.graduation_status == "가능":
-        reasons.append(f"남은 {analysis.remaining_semesters}학기 내 이수 가능")
-    elif result.graduation_status == "위험":
-        reasons.append(f"학기당 집중 이수 시 이수 가능")
-    else:
-        reasons.append(f"현재 학점으로는 졸업이 어려움")
+    reasons = [
+        GRADUATION_STATUS_REASONS.get(
+            result.graduation_status, GRADUATION_STATUS_REASON_DEFAULT
+        ).format(remaining_semesters=analysis.remaining_semesters),
+        f"총 {total_deficit}학점만 추가 이수 필요" if total_deficit <= 36 else f"총 {total_deficit}학점 추가 이수 필요",
+    ]
     
-    if total_deficit <= 36:
-        reasons.append(f"총 {total_deficit}학점만 추가 이수 필요")
-    else:
-        reasons.append(f"총 {total_deficit}학점 추가 이수 필요")
-    
-    if result.program_type == "복수전공":
-        reasons.append("학위 2개 취득 가능")
-    elif result.program_type == "부전공":
-        reasons.append("비교적 적은 학점으로 이수 가능")
-    elif result.program_type == "융합전공":
-        reasons.append("융합적 역량 강화")
-    elif result.program_type == "융합부전공":
-        reasons.append("적은 학점으로 융합 역량 확보")
-    elif result.program_type == "연계전공":
-        reasons.append("다양한 학문 간 연계 학습")
+    program_reason = PROGRAM_RECOMMENDATION_REASONS.get(result.program_type)
+    if program_reason:
+        reasons.append(program_reason)
     
     return " / ".join(reasons)
 
@@ -1020,9 +1415,14 @@ def run_simulation(student: StudentInput) -> AnalysisOutput:
     # 데이터 로드
     pr_df = load_primary_requirements()
     gr_df = load_graduation_requirements()
+    pr_index = load_primary_requirement_index()
+    gr_index = load_graduation_requirement_index()
+    
+    # 학생 입력 기반 공통 항목 (현재 상태/제도별 분석에서 공유)
+    base = compute_base_analysis(student)
     
     # 현재 상태 분석
-    output.current_analysis = analyze_current_status(student, pr_df)
+    output.current_analysis = analyze_current_status(student, pr_df, pr_index, base)
     
     _, output.current_can_graduate = determine_graduation_status(
         output.current_analysis.deficit_graduation,
@@ -1033,19 +1433,9 @@ def run_simulation(student: StudentInput) -> AnalysisOutput:
     )
     
     if student.student_type == "신규 신청자" and student.desired_multi_major:
-        # 선택한 전공이 융합전공인지 확인
-        try:
-            majors_info_df = pd.read_excel('data/majors_info.xlsx')
-            selected_major_info = majors_info_df[majors_info_df['전공명'] == student.desired_multi_major]
-            
-            is_convergence_major = False
-            if not selected_major_info.empty:
-                # 제도유형에 '융합전공'이 포함되어 있으면 융합전공으로 판단
-                major_type = selected_major_info.iloc[0]['제도유형']
-                if pd.notna(major_type) and '융합전공' in str(major_type):
-                    is_convergence_major = True
-        except:
-            is_convergence_major = False
+        # 선택한 전공이 융합전공인지 확인 (제도유형에 '융합전공' 포함 여부)
+        major_type = load_major_type_map().get(student.desired_multi_major, "")
+        is_convergence_major = '융합전공' in major_type
         
         # 융합전공 여부에 따라 분석할 제도 결정
         if is_convergence_major:
@@ -1055,14 +1445,13 @@ def run_simulation(student: StudentInput) -> AnalysisOutput:
             # 일반전공: 복수전공, 부전공, 연계전공만
             programs = ["복수전공", "부전공", "연계전공"]
         
-        for program in programs:
-            result = simulate_program(
+        output.simulation_results = [
+            simulate_program_with_plan(
                 student, program, student.desired_multi_major,
-                pr_df, gr_df
+                pr_df, gr_df, pr_index, gr_index, base
             )
-            # 학기별 이수 계획 생성
-            result.semester_plan = generate_semester_plan(result.credit_analysis, student)
-            output.simulation_results.append(result)
+            for program in programs
+        ]
         
         # 추천 순위 정렬
         output.recommended_programs, output.supplementary_programs = rank_recommendations(
@@ -1070,52 +1459,14 @@ def run_simulation(student: StudentInput) -> AnalysisOutput:
         )
     
     elif student.student_type == "기존 참여자" and student.current_program and student.current_multi_major:
-        # 현재 참여 중인 제도만 분석
+        # 현재 참여 중인 제도만 분석 (기존 참여자의 다전공 이수 학점 반영)
         result = simulate_program(
             student, student.current_program, student.current_multi_major,
-            pr_df, gr_df
-        )
-        # 기존 참여자의 이수 학점 반영
-        result.credit_analysis.completed_multi_required = student.credits_multi_required
-        result.credit_analysis.completed_multi_elective = student.credits_multi_elective
-        result.credit_analysis.deficit_multi_required = calculate_deficit(
-            student.credits_multi_required,
-            result.credit_analysis.req_multi_required
-        )
-        result.credit_analysis.deficit_multi_elective = calculate_deficit(
-            student.credits_multi_elective,
-            result.credit_analysis.req_multi_elective
-        )
-        
-        # 총 이수 학점 재계산 (다전공 학점 포함)
-        if student.admission_type == "신입학":
-            result.credit_analysis.completed_total = (
-                student.credits_basic_literacy +
-                student.credits_basic_science +
-                student.credits_core_liberal +
-                student.credits_major_required +
-                student.credits_major_elective +
-                student.credits_multi_required +
-                student.credits_multi_elective +
-                student.credits_free
-            )
-        else:
-            result.credit_analysis.completed_total = (
-                student.transfer_credits +
-                student.credits_major_required +
-                student.credits_major_elective +
-                student.credits_multi_required +
-                student.credits_multi_elective +
-                student.credits_free
-            )
-        
-        # 졸업학점 부족분 재계산
-        result.credit_analysis.deficit_graduation = calculate_deficit(
-            result.credit_analysis.completed_total,
-            result.credit_analysis.req_graduation_credits
+            pr_df, gr_df, pr_index, gr_index, base,
+            (student.credits_multi_required, student.credits_multi_elective)
         )
         
-        # 학기별 이수 계획 생성 (부족 학점 재계산 후)
+        # 학기별 이수 계획 생성
         result.semester_plan = generate_semester_plan(result.credit_analysis, student)
         
         output.simulation_results.append(result)
@@ -1123,74 +1474,111 @@ def run_simulation(student: StudentInput) -> AnalysisOutput:
     return output
 
 
+@st.cache_data(show_spinner="분석 중...")
+def run_simulation_cached(student_values: Tuple) -> AnalysisOutput:
+    """run_simulation 결과 캐시 (StudentInput 필드값 튜플 기준)"""
+    return run_simulation(StudentInput(*student_values))
+
+
 # ============================================================
 # Streamlit UI 함수
 # ============================================================
 
+# 진행 단계 (이모지, 라벨)
+SIMULATION_STEPS = (
+    ("1️⃣", "유형 선택"),
+    ("2️⃣", "기본 정보"),
+    ("3️⃣", "학점 입력"),
+    ("4️⃣", "결과 확인"),
+)
+
+# 다전공 비교 분석 페이지 공통 CSS (매 실행마다 페이지 상단에서 한 번만 출력)
+SIMULATION_CSS = """
+<style>
+    .sim-section-title { font-size: 1.3rem; font-weight: 600; margin: 20px 0 16px 0; }
+    .sim-step { padding: 10px; border-radius: 10px; text-align: center; }
+    .sim-step-active { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; }
+    .sim-step-done { background: #28a745; color: white; }
+    .sim-step-todo { background: #e9ecef; color: #666; }
+    .sim-step-icon { font-size: 1.5rem; }
+    .sim-step-label { font-size: 0.85rem; }
+    .sim-step-active .sim-step-label { font-weight: bold; }
+</style>
+"""
+
+# 진행 단계 카드 HTML 템플릿 (현재 / 완료 / 예정)
+_STEP_ACTIVE_TPL = string.Template("""<div class="sim-step sim-step-active">
+<div class="sim-step-icon">${emoji}</div>
+<div class="sim-step-label">${label}</div>
+</div>""")
+_STEP_DONE_TPL = string.Template("""<div class="sim-step sim-step-done">
+<div class="sim-step-icon">✅</div>
+<div class="sim-step-label">${label}</div>
+</div>""")
+_STEP_TODO_TPL = string.Template("""<div class="sim-step sim-step-todo">
+<div class="sim-step-icon">${emoji}</div>
+<div class="sim-step-label">${label}</div>
+</div>""")
+
+# 페이지 제목 HTML
+_SIMULATION_PAGE_HEADER_HTML = """
+<p style="text-align: center; color: #667eea; margin-bottom: 10px; font-size: 2rem; font-weight: 600;">
+    🎯 다전공 비교 분석
+</p>
+<p style="text-align: center; color: #666; margin-bottom: 30px;">
+    희망 전공을 여러 제도로 이수할 때 필요한 학점을 비교해보세요!
+</p>
+"""
+
+
+@lru_cache(maxsize=None)
+def step_indicator_html(current_step: int) -> str:
+    """진행 단계 표시 HTML (4단계 카드, 단계별로 1회만 생성)"""
+    step_cards = []
+    for idx, (emoji, label) in enumerate(SIMULATION_STEPS):
+        if idx + 1 == current_step:
+            step_cards.append(_STEP_ACTIVE_TPL.substitute(emoji=emoji, label=label))
+        elif idx + 1 < current_step:
+            step_cards.append(_STEP_DONE_TPL.substitute(label=label))
+        else:
+            step_cards.append(_STEP_TODO_TPL.substitute(emoji=emoji, label=label))
+    
+    return (
+        '<div style="display: grid; grid-template-columns: repeat(4, 1fr); gap: 1rem;">'
+        + "".join(step_cards) +
+        '</div>'
+    )
+
+
+def save_session_values(values: Dict[str, object]) -> None:
+    """입력값을 세션에 저장 (값이 바뀐 키만 기록)
+    
+    위젯 key는 위젯이 그려지지 않는 단계에서 지워지므로 STEP 4에서 읽을 값은 sim_* 키로 보관
+    """
+    for key, value in values.items():
+        if key not in st.session_state or st.session_state[key] != value:
+            st.session_state[key] = value
+
+
 def render_simulation_page():
     """다전공 비교 분석 페이지"""
     
-    st.markdown("""
-    <p style="text-align: center; color: #667eea; margin-bottom: 10px; font-size: 2rem; font-weight: 600;">
-        🎯 다전공 비교 분석
-    </p>
-    <p style="text-align: center; color: #666; margin-bottom: 30px;">
-        희망 전공을 여러 제도로 이수할 때 필요한 학점을 비교해보세요!
-    </p>
-    """, unsafe_allow_html=True)
+    st.markdown(SIMULATION_CSS + _SIMULATION_PAGE_HEADER_HTML, unsafe_allow_html=True)
     
     # 진행 단계 표시
     if 'sim_step' not in st.session_state:
         st.session_state.sim_step = 1
     
-    # 탭 대신 단계별 진행
-    col1, col2, col3, col4 = st.columns(4)
-    
-    steps = [
-        ("1️⃣", "유형 선택"),
-        ("2️⃣", "기본 정보"),
-        ("3️⃣", "학점 입력"),
-        ("4️⃣", "결과 확인")
-    ]
-    
-    for idx, (col, (emoji, label)) in enumerate(zip([col1, col2, col3, col4], steps)):
-        with col:
-            if idx + 1 == st.session_state.sim_step:
-                st.markdown(f"""
-                <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
-                            color: white; padding: 10px; border-radius: 10px; text-align: center;">
-                    <div style="font-size: 1.5rem;">{emoji}</div>
-                    <div style="font-size: 0.85rem; font-weight: bold;">{label}</div>
-                </div>
-                """, unsafe_allow_html=True)
-            elif idx + 1 < st.session_state.sim_step:
-                st.markdown(f"""
-                <div style="background: #28a745; color: white; padding: 10px; 
-                            border-radius: 10px; text-align: center;">
-                    <div style="font-size: 1.5rem;">✅</div>
-                    <div style="font-size: 0.85rem;">{label}</div>
-                </div>
-                """, unsafe_allow_html=True)
-            else:
-                st.markdown(f"""
-                <div style="background: #e9ecef; color: #666; padding: 10px; 
-                            border-radius: 10px; text-align: center;">
-                    <div style="font-size: 1.5rem;">{emoji}</div>
-                    <div style="font-size: 0.85rem;">{label}</div>
-                </div>
-                """, unsafe_allow_html=True)
+    # 탭 대신 단계별 진행 (4단계 표시를 한 번의 markdown으로 출력)
+    current_step = st.session_state.sim_step
+    st.markdown(step_indicator_html(current_step), unsafe_allow_html=True)
     
     st.markdown("<br>", unsafe_allow_html=True)
     
     # 단계별 컨텐츠
-    if st.session_state.sim_step == 1:
-        render_step1_student_type()
-    elif st.session_state.sim_step == 2:
-        render_step2_basic_info()
-    elif st.session_state.sim_step == 3:
-        render_step3_credits()
-    elif st.session_state.sim_step == 4:
-        render_step4_results()
+    render_step = STEP_RENDERERS.get(current_step)
+    if render_step is not None:
+        render_step()
 
 
 def render_step1_student_type():
@@ -1230,45 +1618,48 @@ def render_step1_student_type():
         """, unsafe_allow_html=True)
 
 
-def render_step2_basic_info():
-    """STEP 2: 기본 정보 입력"""
-    
-    st.markdown(f"""
+# STEP 2 제목 카드 (학생 유형별 HTML을 미리 생성)
+_STEP2_HEADER_TPL = string.Template("""
     <div style="background: linear-gradient(135deg, #667eea15 0%, #764ba215 100%); 
                 border-radius: 15px; padding: 20px; margin-bottom: 20px;">
         <p style="color: #667eea; margin: 0; font-size: 1.3rem; font-weight: 600;">
-            {'🆕 신규 신청자' if st.session_state.sim_student_type == '신규 신청자' else '📚 기존 참여자'} - 기본 정보
+            ${title} - 기본 정보
         </p>
     </div>
-    """, unsafe_allow_html=True)
+    """)
+_STEP2_HEADER_HTML = {
+    "신규 신청자": _STEP2_HEADER_TPL.substitute(title='🆕 신규 신청자'),
+    "기존 참여자": _STEP2_HEADER_TPL.substitute(title='📚 기존 참여자'),
+}
+
+
+def render_step2_basic_info():
+    """STEP 2: 기본 정보 입력"""
+    
+    st.markdown(
+        _STEP2_HEADER_HTML.get(st.session_state.sim_student_type, _STEP2_HEADER_HTML["기존 참여자"]),
+        unsafe_allow_html=True
+    )
     
     # 본전공 목록을 계열별로 구분하여 가져오기 (융합전공 제외)
     try:
-        majors_info_df = pd.read_excel('data/majors_info.xlsx')
-        
-        # 융합전공 제외 - 제도유형에 '융합전공'이 포함되지 않은 전공만
-        primary_majors_df = majors_info_df[~majors_info_df['제도유형'].str.contains('융합전공', na=False)]
-        
-        # 계열별로 그룹화하여 정렬된 리스트 생성
+        primary_majors_options = load_primary_major_options()
+    except (KeyError, ValueError, TypeError) as e:
+        logging.warning(f"본전공 목록 생성 실패: {e}")
         primary_majors_options = []
-        for category in sorted(primary_majors_df['계열'].unique()):
-            # 계열 구분선 추가
-            primary_majors_options.append(f"━━━━━ 📚 {category} ━━━━━")
-            # 해당 계열의 전공들 추가
-            category_majors = sorted(primary_majors_df[primary_majors_df['계열'] == category]['전공명'].tolist())
-            primary_majors_options.extend(category_majors)
-        
-        if not primary_majors_options:
-            primary_majors_options = ["경영학전공", "컴퓨터공학전공", "영미언어문화전공"]
-    except:
+    
+    if not primary_majors_options:
         primary_majors_options = ["경영학전공", "컴퓨터공학전공", "영미언어문화전공"]
     
+    # 계열 구분선 (선택 시 미선택으로 처리)
+    separators = load_category_separators()
+    
     col1, col2 = st.columns(2)
     
     with col1:
         admission_year = st.selectbox(
             "📅 입학연도",
-            options=list(range(2025, 2019, -1)),
+            options=ADMISSION_YEAR_OPTIONS,
             help="학번 기준 연도를 선택하세요"
         )
         
@@ -1279,19 +1670,19 @@ def render_step2_basic_info():
         )
         
         # 구분선이 선택된 경우 처리
-        if primary_major and primary_major.startswith("━━━━━"):
+        if primary_major in separators:
             primary_major = None
     
     with col2:
         admission_type = st.selectbox(
             "📝 입학구분",
-            options=["신입학", "3학년 편입학(동일계)", "3학년 편입학(비동일계)"]
+            options=ADMISSION_TYPE_OPTIONS
         )
         
-        max_sem = 8 if admission_type == "신입학" else 4
+        semester_options = FRESHMAN_SEMESTER_OPTIONS if admission_type == "신입학" else TRANSFER_SEMESTER_OPTIONS
         completed_semesters = st.selectbox(
             "📆 현재까지 이수한 학기 수",
-            options=list(range(1, max_sem + 1)),
+            options=semester_options,
             help="휴학 학기 제외"
         )
     
@@ -1311,39 +1702,19 @@ def render_step2_basic_info():
     desired_multi_major = None
     if st.session_state.sim_student_type == "신규 신청자":
         st.markdown("---")
-        st.markdown('<p style="font-size: 1.3rem; font-weight: 600; margin: 20px 0 16px 0;">🎯 희망하는 다전공</p>', unsafe_allow_html=True)
+        st.markdown('<p class="sim-section-title">🎯 희망하는 다전공</p>', unsafe_allow_html=True)
         
         # 다전공 목록을 계열별로 구분하여 가져오기
         try:
-            majors_info_df = pd.read_excel('data/majors_info.xlsx')
-            gr_df = pd.read_excel('data/graduation_requirements.xlsx')
-            
-            # 복수전공 또는 융합전공으로 가능한 전공들 필터링
-            double_majors = gr_df[gr_df['제도유형'] == '복수전공']['전공명'].unique()
-            
-            # majors_info에서 복수전공 가능한 전공들 + 융합전공 제도 전공들 가져오기
-            # 제도유형에 '융합전공'이 포함된 전공들도 추가
-            available_majors = majors_info_df[
-                (majors_info_df['전공명'].isin(double_majors)) | 
-                (majors_info_df['제도유형'].str.contains('융합전공', na=False))
-            ]
-            
-            # 계열별로 그룹화하여 정렬된 리스트 생성
+            # 복수전공 가능한 전공들 + 제도유형에 '융합전공'이 포함된 전공들
+            multi_majors_options = load_multi_major_options("복수전공", "융합전공")
+        except (KeyError, ValueError, TypeError) as e:
+            logging.warning(f"다전공 목록 생성 실패: {e}")
             multi_majors_options = []
-            for category in sorted(available_majors['계열'].unique()):
-                # 계열 구분선 추가
-                multi_majors_options.append(f"━━━━━ 📚 {category} ━━━━━")
-                # 해당 계열의 전공들 추가
-                category_majors = sorted(available_majors[available_majors['계열'] == category]['전공명'].tolist())
-                multi_majors_options.extend(category_majors)
-            
-            if not multi_majors_options:
-                multi_majors_options = majors
-        except:
-            multi_majors = load_multi_majors_by_program("복수전공")
-            if not multi_majors:
-                multi_majors = majors
-            multi_majors_options = multi_majors
+        
+        # 계열별 목록을 만들지 못하면 제도별 목록 → 전체 전공 목록 순으로 대체
+        if not multi_majors_options:
+            multi_majors_options = load_multi_majors_by_program("복수전공") or load_majors_list()
         
         desired_multi_major = st.selectbox(
             "다전공으로 이수하고 싶은 전공",
@@ -1352,7 +1723,7 @@ def render_step2_basic_info():
         )
         
         # 구분선이 선택된 경우 처리
-        if desired_multi_major and desired_multi_major.startswith("━━━━━"):
+        if desired_multi_major in separators:
             desired_multi_major = None
     
     # 기존 참여자 정보
@@ -1360,47 +1731,27 @@ def render_step2_basic_info():
     current_multi_major = None
     if st.session_state.sim_student_type == "기존 참여자":
         st.markdown("---")
-        st.markdown('<p style="font-size: 1.3rem; font-weight: 600; margin: 20px 0 16px 0;">📚 현재 참여 중인 다전공</p>', unsafe_allow_html=True)
+        st.markdown('<p class="sim-section-title">📚 현재 참여 중인 다전공</p>', unsafe_allow_html=True)
         
         col1, col2 = st.columns(2)
         with col1:
             current_program = st.selectbox(
                 "참여 중인 제도",
-                options=["복수전공", "부전공", "융합전공", "융합부전공", "연계전공"]
+                options=CURRENT_PROGRAM_OPTIONS
             )
         
         with col2:
             # 계열별로 구분된 다전공 목록 생성
             try:
-                majors_info_df = pd.read_excel('data/majors_info.xlsx')
-                gr_df = pd.read_excel('data/graduation_requirements.xlsx')
-                
-                # 선택된 제도에 해당하는 전공들 필터링
-                program_majors = gr_df[gr_df['제도유형'] == current_program]['전공명'].unique()
-                
-                # majors_info에서 해당 전공들 가져오기
-                # 제도유형 문자열에 현재 선택한 제도가 포함된 전공들도 추가
-                available_majors = majors_info_df[
-                    (majors_info_df['전공명'].isin(program_majors)) | 
-                    (majors_info_df['제도유형'].str.contains(current_program, na=False))
-                ]
-                
-                # 계열별로 그룹화하여 정렬된 리스트 생성
+                # 선택된 제도에 해당하는 전공들 + 제도유형 문자열에 현재 제도가 포함된 전공들
+                current_multi_majors_options = load_multi_major_options(current_program, current_program)
+            except (KeyError, ValueError, TypeError) as e:
+                logging.warning(f"참여 중인 다전공 목록 생성 실패: {e}")
                 current_multi_majors_options = []
-                for category in sorted(available_majors['계열'].unique()):
-                    # 계열 구분선 추가
-                    current_multi_majors_options.append(f"━━━━━ 📚 {category} ━━━━━")
-                    # 해당 계열의 전공들 추가
-                    category_majors = sorted(available_majors[available_majors['계열'] == category]['전공명'].tolist())
-                    current_multi_majors_options.extend(category_majors)
-                
-                if not current_multi_majors_options:
-                    current_multi_majors_options = majors
-            except:
-                multi_majors = load_multi_majors_by_program(current_program)
-                if not multi_majors:
-                    multi_majors = majors
-                current_multi_majors_options = multi_majors
+            
+            # 계열별 목록을 만들지 못하면 제도별 목록 → 전체 전공 목록 순으로 대체
+            if not current_multi_majors_options:
+                current_multi_majors_options = load_multi_majors_by_program(current_program) or load_majors_list()
             
             current_multi_major = st.selectbox(
                 "참여 중인 다전공명",
@@ -1408,18 +1759,20 @@ def render_step2_basic_info():
             )
             
             # 구분선이 선택된 경우 처리
-            if current_multi_major and current_multi_major.startswith("━━━━━"):
+            if current_multi_major in separators:
                 current_multi_major = None
     
     # 세션에 저장
-    st.session_state.sim_admission_year = admission_year
-    st.session_state.sim_primary_major = primary_major
-    st.session_state.sim_admission_type = admission_type
-    st.session_state.sim_completed_semesters = completed_semesters
-    st.session_state.sim_transfer_credits = transfer_credits
-    st.session_state.sim_desired_multi_major = desired_multi_major
-    st.session_state.sim_current_program = current_program
-    st.session_state.sim_current_multi_major = current_multi_major
+    save_session_values({
+        "sim_admission_year": admission_year,
+        "sim_primary_major": primary_major,
+        "sim_admission_type": admission_type,
+        "sim_completed_semesters": completed_semesters,
+        "sim_transfer_credits": transfer_credits,
+        "sim_desired_multi_major": desired_multi_major,
+        "sim_current_program": current_program,
+        "sim_current_multi_major": current_multi_major,
+    })
     
     # 네비게이션 버튼
     st.markdown("<br>", unsafe_allow_html=True)
@@ -1436,6 +1789,46 @@ def render_step2_basic_info():
             st.rerun()
 
 
+# 학점 입력 항목 (StudentInput 필드명, 라벨, 도움말)
+LIBERAL_CREDIT_INPUTS = (
+    ("credits_basic_literacy", "기초교양(기초문해)", "기초문해 영역 이수 학점"),
+    ("credits_basic_science", "기초교양(기초과학)", "기초과학 영역 이수 학점 (해당 시)"),
+    ("credits_core_liberal", "핵심교양", "핵심교양 영역 이수 학점"),
+)
+MAJOR_CREDIT_INPUTS = (
+    ("credits_major_required", "전공필수 학점", "본전공 전공필수 이수 학점"),
+    ("credits_major_elective", "전공선택 학점", "본전공 전공선택 이수 학점"),
+)
+MULTI_CREDIT_INPUTS = (
+    ("credits_multi_required", "다전공 전공필수 학점", "다전공 전공필수 이수 학점"),
+    ("credits_multi_elective", "다전공 전공선택 학점", "다전공 전공선택 이수 학점"),
+)
+CREDIT_INPUT_FIELDS = tuple(
+    name for name, _, _ in LIBERAL_CREDIT_INPUTS + MAJOR_CREDIT_INPUTS + MULTI_CREDIT_INPUTS
+) + ("credits_free",)
+
+
+# STEP 3 총 이수 학점 미리보기
+_TOTAL_CREDITS_TPL = string.Template("""
+    <div style="background: #e3f2fd; border-radius: 10px; padding: 15px; margin-top: 20px;">
+        <p style="color: #1565c0; margin: 0; font-size: 1.1rem; font-weight: 600;">📊 총 이수 학점: <span style="font-size: 1.5rem;">${total}</span>학점</p>
+    </div>
+    """)
+
+
+def render_credit_inputs(inputs: Tuple, max_value: int) -> Dict[str, int]:
+    """학점 입력 위젯을 한 줄에 나란히 렌더링 (필드명 → 입력값)"""
+    values = {}
+    for col, (name, label, help_text) in zip(st.columns(len(inputs)), inputs):
+        with col:
+            values[name] = st.number_input(
+                label,
+                min_value=0, max_value=max_value, value=0,
+                help=help_text
+            )
+    return values
+
+
 def render_step3_credits():
     """STEP 3: 학점 입력"""
     
@@ -1449,109 +1842,40 @@ def render_step3_credits():
     </div>
     """, unsafe_allow_html=True)
     
-    # 교양 학점 (신입학만)
-    credits_basic_literacy = 0
-    credits_basic_science = 0
-    credits_core_liberal = 0
+    # 입력하지 않는 항목(교양: 편입학, 다전공: 신규 신청자)은 0
+    credits = dict.fromkeys(CREDIT_INPUT_FIELDS, 0)
     
+    # 교양 학점 (신입학만)
     if st.session_state.sim_admission_type == "신입학":
-        st.markdown('<p style="font-size: 1.3rem; font-weight: 600; margin: 20px 0 16px 0;">📚 교양 이수 학점</p>', unsafe_allow_html=True)
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            credits_basic_literacy = st.number_input(
-                "기초교양(기초문해)",
-                min_value=0, max_value=30, value=0,
-                help="기초문해 영역 이수 학점"
-            )
-        
-        with col2:
-            credits_basic_science = st.number_input(
-                "기초교양(기초과학)",
-                min_value=0, max_value=30, value=0,
-                help="기초과학 영역 이수 학점 (해당 시)"
-            )
-        
-        with col3:
-            credits_core_liberal = st.number_input(
-                "핵심교양",
-                min_value=0, max_value=30, value=0,
-                help="핵심교양 영역 이수 학점"
-            )
+        st.markdown('<p class="sim-section-title">📚 교양 이수 학점</p>', unsafe_allow_html=True)
+        credits.update(render_credit_inputs(LIBERAL_CREDIT_INPUTS, max_value=30))
     
     # 본전공 학점
-    st.markdown('<p style="font-size: 1.3rem; font-weight: 600; margin: 20px 0 16px 0;">🎓 본전공 이수 학점</p>', unsafe_allow_html=True)
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        credits_major_required = st.number_input(
-            "전공필수 학점",
-            min_value=0, max_value=60, value=0,
-            help="본전공 전공필수 이수 학점"
-        )
-    
-    with col2:
-        credits_major_elective = st.number_input(
-            "전공선택 학점",
-            min_value=0, max_value=60, value=0,
-            help="본전공 전공선택 이수 학점"
-        )
+    st.markdown('<p class="sim-section-title">🎓 본전공 이수 학점</p>', unsafe_allow_html=True)
+    credits.update(render_credit_inputs(MAJOR_CREDIT_INPUTS, max_value=60))
     
     # 다전공 학점 (기존 참여자만)
-    credits_multi_required = 0
-    credits_multi_elective = 0
-    
     if st.session_state.sim_student_type == "기존 참여자":
-        st.markdown(f'<p style="font-size: 1.3rem; font-weight: 600; margin: 20px 0 16px 0;">📘 다전공 이수 학점 ({st.session_state.sim_current_program})</p>', unsafe_allow_html=True)
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            credits_multi_required = st.number_input(
-                "다전공 전공필수 학점",
-                min_value=0, max_value=60, value=0,
-                help="다전공 전공필수 이수 학점"
-            )
-        
-        with col2:
-            credits_multi_elective = st.number_input(
-                "다전공 전공선택 학점",
-                min_value=0, max_value=60, value=0,
-                help="다전공 전공선택 이수 학점"
-            )
+        st.markdown(f'<p class="sim-section-title">📘 다전공 이수 학점 ({st.session_state.sim_current_program})</p>', unsafe_allow_html=True)
+        credits.update(render_credit_inputs(MULTI_CREDIT_INPUTS, max_value=60))
     
     # 잔여 학점
-    st.markdown('<p style="font-size: 1.3rem; font-weight: 600; margin: 20px 0 16px 0;">📋 기타 이수 학점</p>', unsafe_allow_html=True)
-    credits_free = st.number_input(
+    st.markdown('<p class="sim-section-title">📋 기타 이수 학점</p>', unsafe_allow_html=True)
+    credits['credits_free'] = st.number_input(
         "잔여(자유) 학점",
         min_value=0, max_value=60, value=0,
         help="소양교양, 자유선택 등 기타 이수 학점"
     )
     
-    # 총 이수 학점 미리보기
-    if st.session_state.sim_admission_type == "신입학":
-        total = (credits_basic_literacy + credits_basic_science + credits_core_liberal +
-                credits_major_required + credits_major_elective + 
-                credits_multi_required + credits_multi_elective + credits_free)
-    else:
-        total = (st.session_state.sim_transfer_credits +
-                credits_major_required + credits_major_elective +
-                credits_multi_required + credits_multi_elective + credits_free)
+    # 총 이수 학점 미리보기 (편입학은 교양 대신 편입 인정학점 포함)
+    total = sum(credits.values())
+    if st.session_state.sim_admission_type != "신입학":
+        total += st.session_state.sim_transfer_credits
     
-    st.markdown(f"""
-    <div style="background: #e3f2fd; border-radius: 10px; padding: 15px; margin-top: 20px;">
-        <p style="color: #1565c0; margin: 0; font-size: 1.1rem; font-weight: 600;">📊 총 이수 학점: <span style="font-size: 1.5rem;">{total}</span>학점</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_TOTAL_CREDITS_TPL.substitute(total=total), unsafe_allow_html=True)
     
     # 세션에 저장
-    st.session_state.sim_credits_basic_literacy = credits_basic_literacy
-    st.session_state.sim_credits_basic_science = credits_basic_science
-    st.session_state.sim_credits_core_liberal = credits_core_liberal
-    st.session_state.sim_credits_major_required = credits_major_required
-    st.session_state.sim_credits_major_elective = credits_major_elective
-    st.session_state.sim_credits_multi_required = credits_multi_required
-    st.session_state.sim_credits_multi_elective = credits_multi_elective
-    st.session_state.sim_credits_free = credits_free
+    save_session_values({f"sim_{name}": value for name, value in credits.items()})
     
     # 네비게이션 버튼
     st.markdown("<br>", unsafe_allow_html=True)
@@ -1568,32 +1892,77 @@ def render_step3_credits():
             st.rerun()
 
 
+# 현재 상태 카드의 학점 행 (라벨, 값)
+_CREDIT_ROW_TPL = string.Template("""<tr>
+<td style="padding: 8px 0; color: #666;">${label}</td>
+<td style="text-align: right; font-weight: bold;">${value}</td>
+</tr>""")
+
+# 현재 상태 카드의 부족 학점 행 (라벨, 부족 학점, 색상)
+_DEFICIT_ROW_TPL = string.Template("""<tr>
+<td style="padding: 8px 0; color: #666;">${label}</td>
+<td style="text-align: right; font-weight: bold; color: ${color};">
+${deficit} 학점
+</td>
+</tr>""")
+
+# 현재 상태 - 학점 현황 카드
+_CURRENT_CREDITS_CARD_TPL = string.Template("""
+<div style="background: white; border-radius: 12px; padding: 20px; 
+box-shadow: 0 2px 10px rgba(0,0,0,0.08);">
+<p style="color: #333; margin-bottom: 15px; font-size: 1.1rem; font-weight: 600;">📚 학점 현황</p>
+<table style="width: 100%;">
+${liberal_rows}
+${major_rows}
+${free_row}
+<tr style="border-top: 1px solid #eee;">
+<td style="padding: 12px 0; color: #333; font-weight: bold;">총 이수</td>
+<td style="text-align: right; font-weight: bold; color: #667eea; font-size: 1.1rem;">
+${completed_total} / ${req_graduation_credits} 학점
+</td>
+</tr>
+</table>
+</div>
+""")
+
+# 현재 상태 - 부족 현황 카드
+_CURRENT_DEFICIT_CARD_TPL = string.Template("""
+<div style="background: white; border-radius: 12px; padding: 20px; 
+box-shadow: 0 2px 10px rgba(0,0,0,0.08);">
+<p style="color: #333; margin-bottom: 15px; font-size: 1.1rem; font-weight: 600;">⚠️ 부족 현황</p>
+<table style="width: 100%;">
+${liberal_rows}
+${deficit_rows}
+<tr style="border-top: 1px solid #eee;">
+<td style="padding: 12px 0; color: #333; font-weight: bold;">이수 가능 여부</td>
+<td style="text-align: right; font-weight: bold; color: ${grad_color}; font-size: 1.1rem;">
+${grad_text}
+</td>
+</tr>
+</table>
+</div>
+""")
+
+
+# StudentInput 필드명 → 세션 키 (sim_<필드명>)
+_STUDENT_SESSION_KEYS = tuple((f.name, f"sim_{f.name}") for f in fields(StudentInput))
+# 다전공 비교 분석 페이지가 쓰는 세션 키 전체 (처음부터 시 삭제)
+SIMULATION_SESSION_KEYS = ("sim_step",) + tuple(key for _, key in _STUDENT_SESSION_KEYS)
+
+
+def student_input_from_session(state) -> StudentInput:
+    """세션의 sim_<필드명> 값으로 StudentInput 생성 (없는 항목은 기본값)"""
+    return StudentInput(**{name: state[key] for name, key in _STUDENT_SESSION_KEYS if key in state})
+
+
 def render_step4_results():
     """STEP 4: 결과 확인"""
     
-    # StudentInput 객체 생성
-    student = StudentInput(
-        student_type=st.session_state.sim_student_type,
-        admission_year=st.session_state.sim_admission_year,
-        primary_major=st.session_state.sim_primary_major,
-        admission_type=st.session_state.sim_admission_type,
-        completed_semesters=st.session_state.sim_completed_semesters,
-        transfer_credits=st.session_state.get('sim_transfer_credits', 0),
-        credits_basic_literacy=st.session_state.get('sim_credits_basic_literacy', 0),
-        credits_basic_science=st.session_state.get('sim_credits_basic_science', 0),
-        credits_core_liberal=st.session_state.get('sim_credits_core_liberal', 0),
-        credits_major_required=st.session_state.get('sim_credits_major_required', 0),
-        credits_major_elective=st.session_state.get('sim_credits_major_elective', 0),
-        credits_free=st.session_state.get('sim_credits_free', 0),
-        desired_multi_major=st.session_state.get('sim_desired_multi_major'),
-        current_program=st.session_state.get('sim_current_program'),
-        current_multi_major=st.session_state.get('sim_current_multi_major'),
-        credits_multi_required=st.session_state.get('sim_credits_multi_required', 0),
-        credits_multi_elective=st.session_state.get('sim_credits_multi_elective', 0),
-    )
+    # StudentInput 객체 생성 (세션 값은 한 번만 읽음)
+    student = student_input_from_session(st.session_state)
     
-    # 분석 실행
-    output = run_simulation(student)
+    # 분석 실행 (같은 입력이면 캐시된 결과 사용)
+    output = run_simulation_cached(astuple(student))
     
     # 결과 헤더
     st.markdown("""
@@ -1620,133 +1989,82 @@ def render_step4_results():
     
     # 현재 상태 분석 - 신규 신청자만 표시
     if student.student_type == "신규 신청자":
-        st.markdown('<p style="font-size: 1.3rem; font-weight: 600; margin: 20px 0 16px 0;">📈 현재 상태 (본전공 기준)</p>', unsafe_allow_html=True)
+        st.markdown('<p class="sim-section-title">📈 현재 상태 (본전공 기준)</p>', unsafe_allow_html=True)
         
         analysis = output.current_analysis
         
         col1, col2 = st.columns(2)
         
         with col1:
-            # 학점 현황 카드
-            liberal_html = ""
+            # 학점 현황 카드 (교양 행은 신입학만)
+            liberal_rows = []
             if student.admission_type == "신입학":
-                liberal_html = f"""<tr>
-<td style="padding: 8px 0; color: #666;">기초교양(기초문해)</td>
-<td style="text-align: right; font-weight: bold;">{analysis.completed_basic_literacy} / {analysis.req_basic_literacy} 학점</td>
-</tr>
-<tr>
-<td style="padding: 8px 0; color: #666;">기초교양(기초과학)</td>
-<td style="text-align: right; font-weight: bold;">{analysis.completed_basic_science} / {analysis.req_basic_science} 학점</td>
-</tr>
-<tr>
-<td style="padding: 8px 0; color: #666;">핵심교양</td>
-<td style="text-align: right; font-weight: bold;">{analysis.completed_core_liberal} / {analysis.req_core_liberal} 학점</td>
-</tr>"""
+                liberal_rows = [
+                    ("기초교양(기초문해)", analysis.completed_basic_literacy, analysis.req_basic_literacy),
+                    ("기초교양(기초과학)", analysis.completed_basic_science, analysis.req_basic_science),
+                    ("핵심교양", analysis.completed_core_liberal, analysis.req_core_liberal),
+                ]
+            major_rows = [
+                ("전공필수", analysis.completed_major_required, analysis.req_major_required),
+                ("전공선택", analysis.completed_major_elective, analysis.req_major_elective),
+            ]
             
-            st.markdown(f"""
-<div style="background: white; border-radius: 12px; padding: 20px; 
-box-shadow: 0 2px 10px rgba(0,0,0,0.08);">
-<p style="color: #333; margin-bottom: 15px; font-size: 1.1rem; font-weight: 600;">📚 학점 현황</p>
-<table style="width: 100%;">
-{liberal_html}
-<tr>
-<td style="padding: 8px 0; color: #666;">전공필수</td>
-<td style="text-align: right; font-weight: bold;">{analysis.completed_major_required} / {analysis.req_major_required} 학점</td>
-</tr>
-<tr>
-<td style="padding: 8px 0; color: #666;">전공선택</td>
-<td style="text-align: right; font-weight: bold;">{analysis.completed_major_elective} / {analysis.req_major_elective} 학점</td>
-</tr>
-<tr>
-<td style="padding: 8px 0; color: #666;">자유학점</td>
-<td style="text-align: right; font-weight: bold;">{student.credits_free} 학점</td>
-</tr>
-<tr style="border-top: 1px solid #eee;">
-<td style="padding: 12px 0; color: #333; font-weight: bold;">총 이수</td>
-<td style="text-align: right; font-weight: bold; color: #667eea; font-size: 1.1rem;">
-{analysis.completed_total} / {analysis.req_graduation_credits} 학점
-</td>
-</tr>
-</table>
-</div>
-""", unsafe_allow_html=True)
+            st.markdown(_CURRENT_CREDITS_CARD_TPL.substitute(
+                liberal_rows="\n".join(
+                    _CREDIT_ROW_TPL.substitute(label=label, value=f"{completed} / {required} 학점")
+                    for label, completed, required in liberal_rows
+                ),
+                major_rows="\n".join(
+                    _CREDIT_ROW_TPL.substitute(label=label, value=f"{completed} / {required} 학점")
+                    for label, completed, required in major_rows
+                ),
+                free_row=_CREDIT_ROW_TPL.substitute(label="자유학점", value=f"{student.credits_free} 학점"),
+                completed_total=analysis.completed_total,
+                req_graduation_credits=analysis.req_graduation_credits,
+            ), unsafe_allow_html=True)
         
         with col2:
-            # 부족 학점 카드
-            total_deficit = analysis.deficit_major_required + analysis.deficit_major_elective
-            grad_color = "#28a745" if output.current_can_graduate else "#dc3545"
-            grad_text = "이수 가능" if output.current_can_graduate else "학점 부족"
-            
-            # 교양 부족 HTML
-            liberal_deficit_html = ""
+            # 부족 학점 카드 (교양 행은 신입학만)
+            liberal_rows = []
             if student.admission_type == "신입학":
-                liberal_deficit_html = f"""<tr>
-<td style="padding: 8px 0; color: #666;">기초교양(기초문해) 부족</td>
-<td style="text-align: right; font-weight: bold; color: {'#dc3545' if analysis.deficit_basic_literacy > 0 else '#28a745'};">
-{analysis.deficit_basic_literacy} 학점
-</td>
-</tr>
-<tr>
-<td style="padding: 8px 0; color: #666;">기초교양(기초과학) 부족</td>
-<td style="text-align: right; font-weight: bold; color: {'#dc3545' if analysis.deficit_basic_science > 0 else '#28a745'};">
-{analysis.deficit_basic_science} 학점
-</td>
-</tr>
-<tr>
-<td style="padding: 8px 0; color: #666;">핵심교양 부족</td>
-<td style="text-align: right; font-weight: bold; color: {'#dc3545' if analysis.deficit_core_liberal > 0 else '#28a745'};">
-{analysis.deficit_core_liberal} 학점
-</td>
-</tr>"""
+                liberal_rows = [
+                    ("기초교양(기초문해) 부족", analysis.deficit_basic_literacy),
+                    ("기초교양(기초과학) 부족", analysis.deficit_basic_science),
+                    ("핵심교양 부족", analysis.deficit_core_liberal),
+                ]
+            deficit_rows = [
+                ("전공필수 부족", analysis.deficit_major_required),
+                ("전공선택 부족", analysis.deficit_major_elective),
+                ("졸업학점 부족", analysis.deficit_graduation),
+            ]
             
-            st.markdown(f"""
-<div style="background: white; border-radius: 12px; padding: 20px; 
-box-shadow: 0 2px 10px rgba(0,0,0,0.08);">
-<p style="color: #333; margin-bottom: 15px; font-size: 1.1rem; font-weight: 600;">⚠️ 부족 현황</p>
-<table style="width: 100%;">
-{liberal_deficit_html}
-<tr>
-<td style="padding: 8px 0; color: #666;">전공필수 부족</td>
-<td style="text-align: right; font-weight: bold; color: {'#dc3545' if analysis.deficit_major_required > 0 else '#28a745'};">
-{analysis.deficit_major_required} 학점
-</td>
-</tr>
-<tr>
-<td style="padding: 8px 0; color: #666;">전공선택 부족</td>
-<td style="text-align: right; font-weight: bold; color: {'#dc3545' if analysis.deficit_major_elective > 0 else '#28a745'};">
-{analysis.deficit_major_elective} 학점
-</td>
-</tr>
-<tr>
-<td style="padding: 8px 0; color: #666;">졸업학점 부족</td>
-<td style="text-align: right; font-weight: bold; color: {'#dc3545' if analysis.deficit_graduation > 0 else '#28a745'};">
-{analysis.deficit_graduation} 학점
-</td>
-</tr>
-<tr style="border-top: 1px solid #eee;">
-<td style="padding: 12px 0; color: #333; font-weight: bold;">이수 가능 여부</td>
-<td style="text-align: right; font-weight: bold; color: {grad_color}; font-size: 1.1rem;">
-{grad_text}
-</td>
-</tr>
-</table>
-</div>
-""", unsafe_allow_html=True)
+            grad_color, _, grad_text = GRADUATION_DISPLAY[bool(output.current_can_graduate)]
+            st.markdown(_CURRENT_DEFICIT_CARD_TPL.substitute(
+                liberal_rows="\n".join(
+                    _DEFICIT_ROW_TPL.substitute(label=label, deficit=deficit, color=deficit_color(deficit))
+                    for label, deficit in liberal_rows
+                ),
+                deficit_rows="\n".join(
+                    _DEFICIT_ROW_TPL.substitute(label=label, deficit=deficit, color=deficit_color(deficit))
+                    for label, deficit in deficit_rows
+                ),
+                grad_color=grad_color,
+                grad_text=grad_text,
+            ), unsafe_allow_html=True)
     
     # 신규 신청자: 제도별 비교 분석 결과
     if student.student_type == "신규 신청자" and output.recommended_programs:
         st.markdown("---")
-        st.markdown(f'<p style="font-size: 1.3rem; font-weight: 600; margin: 20px 0 16px 0;">🎯 다전공 제도별 비교 ({student.desired_multi_major})</p>', unsafe_allow_html=True)
+        st.markdown(f'<p class="sim-section-title">🎯 다전공 제도별 비교 ({student.desired_multi_major})</p>', unsafe_allow_html=True)
         
         # 추천 순위 (보조 추천 포함 - 모두 동일하게 표시)
         all_programs = output.recommended_programs + output.supplementary_programs
-        for idx, result in enumerate(all_programs):
-            render_simulation_result_card(result, idx == 0)
+        render_simulation_result_cards(all_programs)
     
     # 기존 참여자: 현재 참여 중인 제도 분석
     elif student.student_type == "기존 참여자" and output.simulation_results:
         st.markdown("---")
-        st.markdown(f'<p style="font-size: 1.3rem; font-weight: 600; margin: 20px 0 16px 0;">📚 현재 참여 중인 다전공 분석 ({student.current_program})</p>', unsafe_allow_html=True)
+        st.markdown(f'<p class="sim-section-title">📚 현재 참여 중인 다전공 분석 ({student.current_program})</p>', unsafe_allow_html=True)
         
         result = output.simulation_results[0]
         render_current_participant_analysis(result, student)
@@ -1763,292 +2081,333 @@ box-shadow: 0 2px 10px rgba(0,0,0,0.08);">
     with col3:
         if st.button("🔄 처음부터", use_container_width=True):
             # 세션 초기화
-            keys_to_delete = [k for k in st.session_state.keys() if k.startswith('sim_')]
-            for k in keys_to_delete:
-                del st.session_state[k]
+            for k in SIMULATION_SESSION_KEYS:
+                st.session_state.pop(k, None)
             st.session_state.sim_step = 1
             st.rerun()
 
 
-def render_simulation_result_card(result: SimulationResult, is_top: bool):
-    """비교 분석 결과 카드 렌더링"""
-    
-    analysis = result.credit_analysis
-    
-    border_style = "3px solid #667eea" if is_top else "1px solid #e9ecef"
-    
-    # 이수 학점 계산 (completed = 이미 이수한 학점, 신규 신청자는 0)
-    completed_major_req = analysis.completed_major_required
-    completed_major_elec = analysis.completed_major_elective
-    completed_multi_req = analysis.completed_multi_required
-    completed_multi_elec = analysis.completed_multi_elective
-    
-    # 부족 학점의 총합 (앞으로 이수해야 하는 학점)
-    total_deficit = (
-        analysis.deficit_major_required + 
-        analysis.deficit_major_elective + 
-        analysis.deficit_multi_required + 
-        analysis.deficit_multi_elective
-    )
-    
-    st.markdown(f"""
+# 단계 번호 → 단계별 렌더링 함수
+STEP_RENDERERS = {
+    1: render_step1_student_type,
+    2: render_step2_basic_info,
+    3: render_step3_credits,
+    4: render_step4_results,
+}
+
+
+# 비교 분석 결과 카드 HTML 템플릿
+_RESULT_CARD_TPL = string.Template("""
 <div style="background: white; border-radius: 12px; padding: 20px; 
-margin-bottom: 15px; border-left: {border_style};
+margin-bottom: 15px; border-left: ${border_style};
 box-shadow: 0 2px 10px rgba(0,0,0,0.05);">
 <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 15px;">
 <div>
 <span style="font-size: 1.3rem; font-weight: bold; color: #333;">
-{result.program_type}
+${program_type}
 </span>
-{f'<span style="background: #667eea; color: white; padding: 3px 10px; border-radius: 15px; font-size: 0.8rem; margin-left: 10px;">👑 추천 1위</span>' if is_top else ''}
+${top_badge}
 </div>
 </div>       
 <div style="display: grid; grid-template-columns: repeat(5, 1fr); gap: 15px; margin-bottom: 15px;">
-<div style="text-align: center; padding: 10px; background: #f8f9fa; border-radius: 8px;">
-<div style="font-size: 0.85rem; color: #666;">본전공 필수</div>
-<div style="font-size: 0.95rem; font-weight: bold; color: #333;">
-{completed_major_req}/{analysis.req_major_required}
-</div>
-<div style="font-size: 0.8rem; color: {'#dc3545' if analysis.deficit_major_required > 0 else '#28a745'}; margin-top: 3px;">
-{'부족 ' + str(analysis.deficit_major_required) if analysis.deficit_major_required > 0 else '✓'}
-</div>
-</div>
-<div style="text-align: center; padding: 10px; background: #f8f9fa; border-radius: 8px;">
-<div style="font-size: 0.85rem; color: #666;">본전공 선택</div>
-<div style="font-size: 0.95rem; font-weight: bold; color: #333;">
-{completed_major_elec}/{analysis.req_major_elective}
-</div>
-<div style="font-size: 0.8rem; color: {'#dc3545' if analysis.deficit_major_elective > 0 else '#28a745'}; margin-top: 3px;">
-{'부족 ' + str(analysis.deficit_major_elective) if analysis.deficit_major_elective > 0 else '✓'}
-</div>
-</div>
-<div style="text-align: center; padding: 10px; background: #e3f2fd; border-radius: 8px;">
-<div style="font-size: 0.85rem; color: #666;">다전공 필수</div>
-<div style="font-size: 0.95rem; font-weight: bold; color: #333;">
-{completed_multi_req}/{analysis.req_multi_required}
-</div>
-<div style="font-size: 0.8rem; color: {'#dc3545' if analysis.deficit_multi_required > 0 else '#28a745'}; margin-top: 3px;">
-{'부족 ' + str(analysis.deficit_multi_required) if analysis.deficit_multi_required > 0 else '✓'}
-</div>
-</div>
-<div style="text-align: center; padding: 10px; background: #e3f2fd; border-radius: 8px;">
-<div style="font-size: 0.85rem; color: #666;">다전공 선택</div>
-<div style="font-size: 0.95rem; font-weight: bold; color: #333;">
-{completed_multi_elec}/{analysis.req_multi_elective}
-</div>
-<div style="font-size: 0.8rem; color: {'#dc3545' if analysis.deficit_multi_elective > 0 else '#28a745'}; margin-top: 3px;">
-{'부족 ' + str(analysis.deficit_multi_elective) if analysis.deficit_multi_elective > 0 else '✓'}
-</div>
-</div>
-<div style="text-align: center; padding: 10px; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); border-radius: 8px;">
+${cells}<div style="text-align: center; padding: 10px; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); border-radius: 8px;">
 <div style="font-size: 0.85rem; color: white; font-weight: bold;">이수해야 하는<br>총 전공 학점수</div>
 <div style="font-size: 1.2rem; font-weight: bold; color: white; margin-top: 5px;">
-{total_deficit}
+${total_deficit}
 </div>
 </div>
 </div>
 <div style="background: #f8f9fa; border-radius: 8px; padding: 12px;">
 <span style="color: #666;">💡 </span>
-<span style="color: #333;">{result.recommendation_reason}</span>
+<span style="color: #333;">${recommendation_reason}</span>
 </div>
 </div>
-""", unsafe_allow_html=True)
-    
-    # 학기별 이수 계획 (펼치기)
-    if result.semester_plan:
-        with st.expander(f"📅 {result.program_type} 학기별 이수 계획"):
-            render_semester_plan_table(result.semester_plan)
+""")
+
+# 결과 카드의 항목별 칸 (이수/기준 학점 + 부족 여부)
+_RESULT_CARD_CELL_TPL = string.Template("""<div style="text-align: center; padding: 10px; background: ${background}; border-radius: 8px;">
+<div style="font-size: 0.85rem; color: #666;">${label}</div>
+<div style="font-size: 0.95rem; font-weight: bold; color: #333;">
+${completed}/${required}
+</div>
+<div style="font-size: 0.8rem; color: ${deficit_color}; margin-top: 3px;">
+${deficit_text}
+</div>
+</div>
+""")
 
+_TOP_BADGE_HTML = '<span style="background: #667eea; color: white; padding: 3px 10px; border-radius: 15px; font-size: 0.8rem; margin-left: 10px;">👑 추천 1위</span>'
 
-def render_current_participant_analysis(result: SimulationResult, student: StudentInput):
-    """기존 참여자 분석 결과 렌더링"""
+
+def build_result_card_html(result: SimulationResult, is_top: bool) -> str:
+    """비교 분석 결과 카드 HTML 생성"""
     
     analysis = result.credit_analysis
     
-    col1, col2 = st.columns(2)
+    # 항목별 칸: (라벨, 배경색, 이수 학점, 기준 학점, 부족 학점)
+    # completed = 이미 이수한 학점 (신규 신청자의 다전공은 0)
+    cell_items = (
+        ("본전공 필수", "#f8f9fa", analysis.completed_major_required, analysis.req_major_required, analysis.deficit_major_required),
+        ("본전공 선택", "#f8f9fa", analysis.completed_major_elective, analysis.req_major_elective, analysis.deficit_major_elective),
+        ("다전공 필수", "#e3f2fd", analysis.completed_multi_required, analysis.req_multi_required, analysis.deficit_multi_required),
+        ("다전공 선택", "#e3f2fd", analysis.completed_multi_elective, analysis.req_multi_elective, analysis.deficit_multi_elective),
+    )
+    cells = "".join(
+        _RESULT_CARD_CELL_TPL.substitute(
+            label=label,
+            background=background,
+            completed=completed,
+            required=required,
+            deficit_color=deficit_color(deficit),
+            deficit_text='부족 ' + str(deficit) if deficit > 0 else '✓',
+        )
+        for label, background, completed, required, deficit in cell_items
+    )
     
-    with col1:
-        st.markdown(f"""
+    return _RESULT_CARD_TPL.substitute(
+        border_style="3px solid #667eea" if is_top else "1px solid #e9ecef",
+        program_type=result.program_type,
+        top_badge=_TOP_BADGE_HTML if is_top else '',
+        cells=cells,
+        # 부족 학점의 총합 (앞으로 이수해야 하는 학점)
+        total_deficit=analysis.total_deficit,
+        recommendation_reason=result.recommendation_reason,
+    )
+
+
+def render_simulation_result_cards(results: List[SimulationResult]):
+    """비교 분석 결과 카드 렌더링 (첫 번째가 추천 1위)
+    
+    카드는 하나의 markdown으로 출력하고, 학기별 이수 계획은 그 아래에 제도별로 펼치기
+    """
+    st.markdown(
+        "".join(build_result_card_html(result, idx == 0) for idx, result in enumerate(results)),
+        unsafe_allow_html=True
+    )
+    
+    # 학기별 이수 계획 (펼치기)
+    for result in results:
+        if result.semester_plan:
+            with st.expander(f"📅 {result.program_type} 학기별 이수 계획"):
+                render_semester_plan_table(result.semester_plan)
+
+
+# 기존 참여자 카드의 학점 행 (라벨, 이수/기준 학점, 부족 여부)
+# 첫 행에만 열 너비(${label_width} 등)를 지정
+_PARTICIPANT_ROW_TPL = string.Template("""                <tr>
+                    <td style="padding: 8px 0; color: #666;${label_width}">${label}</td>
+                    <td style="text-align: right;${value_width}">${completed} / ${required} 학점</td>
+                    <td style="text-align: right;${status_width} color: ${color}; font-weight: bold;">
+                        ${status}
+                    </td>
+                </tr>""")
+
+# 첫 행의 열 너비 (라벨 / 학점 / 부족 여부)
+_PARTICIPANT_ROW_WIDTHS = {"label_width": " width: 50%;", "value_width": " width: 30%;", "status_width": " width: 20%;"}
+_PARTICIPANT_ROW_NO_WIDTHS = {"label_width": "", "value_width": "", "status_width": ""}
+
+
+# 기존 참여자 - 본전공 카드 HTML 템플릿
+_PARTICIPANT_PRIMARY_CARD_TPL = string.Template("""
         <div style="background: white; border-radius: 12px; padding: 20px; 
                     box-shadow: 0 2px 10px rgba(0,0,0,0.08);">
-            <p style="color: #667eea; margin-bottom: 15px; font-size: 1.1rem; font-weight: 600;">🎓 본전공 ({student.primary_major})</p>
+            <p style="color: #667eea; margin-bottom: 15px; font-size: 1.1rem; font-weight: 600;">🎓 본전공 (${primary_major})</p>
             <table style="width: 100%;">
-                <tr>
-                    <td style="padding: 8px 0; color: #666; width: 50%;">기초교양(기초문해)</td>
-                    <td style="text-align: right; width: 30%;">{student.credits_basic_literacy} / {analysis.req_basic_literacy} 학점</td>
-                    <td style="text-align: right; width: 20%; color: {'#dc3545' if analysis.deficit_basic_literacy > 0 else '#28a745'}; font-weight: bold;">
-                        {'부족 ' + str(analysis.deficit_basic_literacy) + '학점' if analysis.deficit_basic_literacy > 0 else '✓'}
-                    </td>
-                </tr>
-                <tr>
-                    <td style="padding: 8px 0; color: #666;">기초교양(기초과학)</td>
-                    <td style="text-align: right;">{student.credits_basic_science} / {analysis.req_basic_science} 학점</td>
-                    <td style="text-align: right; color: {'#dc3545' if analysis.deficit_basic_science > 0 else '#28a745'}; font-weight: bold;">
-                        {'부족 ' + str(analysis.deficit_basic_science) + '학점' if analysis.deficit_basic_science > 0 else '✓'}
-                    </td>
-                </tr>
-                <tr>
-                    <td style="padding: 8px 0; color: #666;">핵심교양</td>
-                    <td style="text-align: right;">{student.credits_core_liberal} / {analysis.req_core_liberal} 학점</td>
-                    <td style="text-align: right; color: {'#dc3545' if analysis.deficit_core_liberal > 0 else '#28a745'}; font-weight: bold;">
-                        {'부족 ' + str(analysis.deficit_core_liberal) + '학점' if analysis.deficit_core_liberal > 0 else '✓'}
-                    </td>
-                </tr>
-                <tr>
-                    <td style="padding: 8px 0; color: #666;">전공필수</td>
-                    <td style="text-align: right;">{student.credits_major_required} / {analysis.req_major_required} 학점</td>
-                    <td style="text-align: right; color: {'#dc3545' if analysis.deficit_major_required > 0 else '#28a745'}; font-weight: bold;">
-                        {'부족 ' + str(analysis.deficit_major_required) + '학점' if analysis.deficit_major_required > 0 else '✓'}
-                    </td>
-                </tr>
-                <tr>
-                    <td style="padding: 8px 0; color: #666;">전공선택</td>
-                    <td style="text-align: right;">{student.credits_major_elective} / {analysis.req_major_elective} 학점</td>
-                    <td style="text-align: right; color: {'#dc3545' if analysis.deficit_major_elective > 0 else '#28a745'}; font-weight: bold;">
-                        {'부족 ' + str(analysis.deficit_major_elective) + '학점' if analysis.deficit_major_elective > 0 else '✓'}
-                    </td>
-                </tr>
+${rows}
                 <tr>
                     <td style="padding: 8px 0; color: #666;">자유학점</td>
-                    <td style="text-align: right;">{student.credits_free} 학점</td>
+                    <td style="text-align: right;">${credits_free} 학점</td>
                     <td></td>
                 </tr>
             </table>
         </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown(f"""
+        """)
+
+# 기존 참여자 - 다전공 카드 HTML 템플릿
+_PARTICIPANT_MULTI_CARD_TPL = string.Template("""
         <div style="background: white; border-radius: 12px; padding: 20px; 
                     box-shadow: 0 2px 10px rgba(0,0,0,0.08);">
-            <p style="color: #764ba2; margin-bottom: 15px; font-size: 1.1rem; font-weight: 600;">📘 다전공 ({student.current_multi_major})</p>
+            <p style="color: #764ba2; margin-bottom: 15px; font-size: 1.1rem; font-weight: 600;">📘 다전공 (${current_multi_major})</p>
             <table style="width: 100%;">
-                <tr>
-                    <td style="padding: 8px 0; color: #666; width: 50%;">전공필수</td>
-                    <td style="text-align: right; width: 30%;">{student.credits_multi_required} / {analysis.req_multi_required} 학점</td>
-                    <td style="text-align: right; width: 20%; color: {'#dc3545' if analysis.deficit_multi_required > 0 else '#28a745'}; font-weight: bold;">
-                        {'부족 ' + str(analysis.deficit_multi_required) + '학점' if analysis.deficit_multi_required > 0 else '✓'}
-                    </td>
-                </tr>
-                <tr>
-                    <td style="padding: 8px 0; color: #666;">전공선택</td>
-                    <td style="text-align: right;">{student.credits_multi_elective} / {analysis.req_multi_elective} 학점</td>
-                    <td style="text-align: right; color: {'#dc3545' if analysis.deficit_multi_elective > 0 else '#28a745'}; font-weight: bold;">
-                        {'부족 ' + str(analysis.deficit_multi_elective) + '학점' if analysis.deficit_multi_elective > 0 else '✓'}
-                    </td>
-                </tr>
+${rows}
             </table>
         </div>
-        """, unsafe_allow_html=True)
+        """)
+
+# 기존 참여자 - 총 이수학점 행 HTML 템플릿
+# 이수 가능 여부와 같은 markdown으로 출력하므로 들여쓰기를 맞추고, 너비는 본전공 카드(2열 중 1열)와 같게
+_PARTICIPANT_TOTAL_TPL = string.Template("""
+    <div style="margin-top: 20px; padding: 8px 0; width: calc(50% - 0.5rem);">
+        <table style="width: 100%;">
+            <tr>
+                <td style="padding: 8px 0; color: #333; font-weight: bold; width: 50%;">📊 총 이수학점 대비 부족학점</td>
+                <td style="text-align: right; font-weight: bold; color: #333; width: 30%;">
+                    ${total_all_completed} / ${req_graduation_credits} 학점
+                </td>
+                <td style="text-align: right; font-weight: bold; color: ${total_color}; width: 20%;">
+                    ${total_status}
+                </td>
+            </tr>
+        </table>
+    </div>
+    """)
+
+# 기존 참여자 - 이수 가능 여부 HTML 템플릿
+_PARTICIPANT_STATUS_TPL = string.Template("""
+    <div style="background: linear-gradient(135deg, ${status_color}15 0%, ${status_color}05 100%); 
+                border-left: 4px solid ${status_color}; border-radius: 12px; 
+                padding: 20px; margin-top: 20px;">
+        <p style="color: ${status_color}; margin: 0 0 10px 0; font-size: 1.1rem; font-weight: 600;">
+            ${status_icon} ${status_text}
+        </p>
+        <p style="color: #666; margin: 0;">
+            남은 학기: <strong>${remaining_semesters}학기</strong> / 
+            남은 필수 이수학점: <strong>${total_deficit}학점</strong> /
+            학기당 평균: <strong>${average_per_semester}학점</strong>
+        </p>
+    </div>
+    """)
+
+
+# 이수 가능 여부별 표시 (색상, 아이콘, 문구)
+GRADUATION_DISPLAY = {
+    True: ("#28a745", "✅", "이수 가능"),
+    False: ("#dc3545", "⚠️", "학점 부족"),
+}
+
+
+def deficit_color(deficit: int) -> str:
+    """부족 학점 표시 색상 (부족: 빨강, 충족: 초록)"""
+    return '#dc3545' if deficit > 0 else '#28a745'
+
+
+def deficit_status(deficit: int) -> str:
+    """부족 학점 표시 문구"""
+    return f"부족 {deficit}학점" if deficit > 0 else '✓'
+
+
+def participant_rows(rows) -> str:
+    """기존 참여자 카드의 학점 행 HTML (rows: (라벨, 이수 학점, 기준 학점, 부족 학점))"""
+    return "\n".join(
+        _PARTICIPANT_ROW_TPL.substitute(
+            _PARTICIPANT_ROW_WIDTHS if idx == 0 else _PARTICIPANT_ROW_NO_WIDTHS,
+            label=label,
+            completed=completed,
+            required=required,
+            color=deficit_color(deficit),
+            status=deficit_status(deficit),
+        )
+        for idx, (label, completed, required, deficit) in enumerate(rows)
+    )
+
+
+def render_current_participant_analysis(result: SimulationResult, student: StudentInput):
+    """기존 참여자 분석 결과 렌더링"""
     
-    # 총 이수 학점 (본전공 카드와 같은 크기)
-    col_total, col_empty = st.columns(2)
+    analysis = result.credit_analysis
     
-    with col_total:
-        total_all_completed = (student.credits_basic_literacy + student.credits_basic_science + 
-                              student.credits_core_liberal + student.credits_major_required + 
-                              student.credits_major_elective + student.credits_free +
-                              student.credits_multi_required + student.credits_multi_elective)
-        
-        # 전체 부족 학점 (교양 부족 제외, 졸업학점으로 판단)
-        total_all_deficit = max(0, analysis.req_graduation_credits - total_all_completed)
-        
-        st.markdown(f"""
-        <div style="margin-top: 20px; padding: 8px 0;">
-            <table style="width: 100%;">
-                <tr>
-                    <td style="padding: 8px 0; color: #333; font-weight: bold; width: 50%;">📊 총 이수학점 대비 부족학점</td>
-                    <td style="text-align: right; font-weight: bold; color: #333; width: 30%;">
-                        {total_all_completed} / {analysis.req_graduation_credits} 학점
-                    </td>
-                    <td style="text-align: right; font-weight: bold; color: {'#dc3545' if total_all_deficit > 0 else '#28a745'}; width: 20%;">
-                        {'부족 ' + str(total_all_deficit) + '학점' if total_all_deficit > 0 else '✓'}
-                    </td>
-                </tr>
-            </table>
-        </div>
-        """, unsafe_allow_html=True)
+    col1, col2 = st.columns(2)
     
-    # 이수 가능 여부
-    # 남은 필수 이수학점 = 본전공 부족 학점 합계 + 다전공 부족 학점 합계
-    primary_deficit = (analysis.deficit_basic_literacy + analysis.deficit_basic_science + 
-                      analysis.deficit_core_liberal + analysis.deficit_major_required + 
-                      analysis.deficit_major_elective)
+    with col1:
+        st.markdown(_PARTICIPANT_PRIMARY_CARD_TPL.substitute(
+            primary_major=student.primary_major,
+            rows=participant_rows((
+                ("기초교양(기초문해)", student.credits_basic_literacy, analysis.req_basic_literacy, analysis.deficit_basic_literacy),
+                ("기초교양(기초과학)", student.credits_basic_science, analysis.req_basic_science, analysis.deficit_basic_science),
+                ("핵심교양", student.credits_core_liberal, analysis.req_core_liberal, analysis.deficit_core_liberal),
+                ("전공필수", student.credits_major_required, analysis.req_major_required, analysis.deficit_major_required),
+                ("전공선택", student.credits_major_elective, analysis.req_major_elective, analysis.deficit_major_elective),
+            )),
+            credits_free=student.credits_free,
+        ), unsafe_allow_html=True)
     
-    multi_deficit = (analysis.deficit_multi_required + analysis.deficit_multi_elective)
+    with col2:
+        st.markdown(_PARTICIPANT_MULTI_CARD_TPL.substitute(
+            current_multi_major=student.current_multi_major,
+            rows=participant_rows((
+                ("전공필수", student.credits_multi_required, analysis.req_multi_required, analysis.deficit_multi_required),
+                ("전공선택", student.credits_multi_elective, analysis.req_multi_elective, analysis.deficit_multi_elective),
+            )),
+        ), unsafe_allow_html=True)
     
-    total_deficit = primary_deficit + multi_deficit
+    # 총 이수 학점 (본전공 카드와 같은 크기)
+    total_all_completed = student.total_completed
     
-    status_color = "#28a745" if result.can_graduate else "#dc3545"
-    status_text = "이수 가능" if result.can_graduate else "학점 부족"
+    # 전체 부족 학점 (교양 부족 제외, 졸업학점으로 판단)
+    total_all_deficit = max(0, analysis.req_graduation_credits - total_all_completed)
     
-    st.markdown(f"""
-    <div style="background: linear-gradient(135deg, {status_color}15 0%, {status_color}05 100%); 
-                border-left: 4px solid {status_color}; border-radius: 12px; 
-                padding: 20px; margin-top: 20px;">
-        <p style="color: {status_color}; margin: 0 0 10px 0; font-size: 1.1rem; font-weight: 600;">
-            {'✅' if result.can_graduate else '⚠️'} {status_text}
-        </p>
-        <p style="color: #666; margin: 0;">
-            남은 학기: <strong>{analysis.remaining_semesters}학기</strong> / 
-            남은 필수 이수학점: <strong>{total_deficit}학점</strong> /
-            학기당 평균: <strong>{total_deficit // max(1, analysis.remaining_semesters)}학점</strong>
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
+    # 이수 가능 여부
+    # 남은 필수 이수학점 = 전공 부족 학점 합계 (total_deficit) + 교양 부족 학점
+    total_deficit = (analysis.total_deficit + analysis.deficit_basic_literacy +
+                     analysis.deficit_basic_science + analysis.deficit_core_liberal)
+    
+    # 총 이수 학점과 이수 가능 여부는 하나의 markdown으로 출력
+    status_color, status_icon, status_text = GRADUATION_DISPLAY[bool(result.can_graduate)]
+    st.markdown(_PARTICIPANT_TOTAL_TPL.substitute(
+        total_all_completed=total_all_completed,
+        req_graduation_credits=analysis.req_graduation_credits,
+        total_color=deficit_color(total_all_deficit),
+        total_status=deficit_status(total_all_deficit),
+    ) + _PARTICIPANT_STATUS_TPL.substitute(
+        status_color=status_color,
+        status_icon=status_icon,
+        status_text=status_text,
+        remaining_semesters=analysis.remaining_semesters,
+        total_deficit=total_deficit,
+        average_per_semester=total_deficit // max(1, analysis.remaining_semesters),
+    ), unsafe_allow_html=True)
     
     
     # 학기별 이수 계획
     if result.semester_plan:
-        st.markdown('<p style="font-size: 1.3rem; font-weight: 600; margin: 20px 0 16px 0;">📅 학기별 이수 계획</p>', unsafe_allow_html=True)
+        st.markdown('<p class="sim-section-title">📅 학기별 이수 계획</p>', unsafe_allow_html=True)
         render_semester_plan_table(result.semester_plan)
 
 
-def render_semester_plan_table(plan: List[Dict]):
+# 학기별 이수 계획 표 컬럼명 (SemesterPlan 필드 순서)
+SEMESTER_PLAN_COLUMNS = ('학년/학기', '기초교양(기초문해)', '기초교양(기초과학)', '핵심교양',
+                         '본전공 필수', '본전공 선택', '다전공 필수', '다전공 선택', '자유학점', '합계')
+# 기초교양(기초과학) 열을 뺀 컬럼명
+SEMESTER_PLAN_COLUMNS_NO_SCIENCE = SEMESTER_PLAN_COLUMNS[:2] + SEMESTER_PLAN_COLUMNS[3:]
+
+# 학기별 이수 계획 표 column_config (st.dataframe이 복사해서 쓰므로 공유 가능)
+SEMESTER_PLAN_COLUMN_CONFIG = {
+    "학년/학기": st.column_config.TextColumn("학년/학기", width="medium"),
+    **{
+        label: st.column_config.NumberColumn(label, format="%d학점")
+        for label in SEMESTER_PLAN_COLUMNS[1:]
+    },
+}
+SEMESTER_PLAN_COLUMN_CONFIG_NO_SCIENCE = {
+    label: SEMESTER_PLAN_COLUMN_CONFIG[label] for label in SEMESTER_PLAN_COLUMNS_NO_SCIENCE
+}
+
+
+@lru_cache(maxsize=64)
+def build_semester_plan_df(plan: Tuple[SemesterPlan, ...]) -> Tuple[pd.DataFrame, bool]:
+    """학기별 이수 계획 표 DataFrame 생성 (같은 계획이면 만들어 둔 DataFrame을 그대로 사용)
+    
+    반환: (DataFrame, 기초교양(기초과학) 열 포함 여부)
+    """
+    # 기초교양(기초과학)이 모든 학기에서 0이면 해당 열 없이 DataFrame 생성
+    has_basic_science = any(row.basic_science > 0 for row in plan)
+    
+    if has_basic_science:
+        # 기초과학이 있는 경우 - 순서: 학년/학기, 기초문해, 기초과학, 핵심교양, 본전공필수, 본전공선택, 다전공필수, 다전공선택, 자유학점, 합계
+        return pd.DataFrame(plan, columns=SEMESTER_PLAN_COLUMNS), True
+    # 기초과학이 없는 경우 (열 제거) - 순서: 학년/학기, 기초문해, 핵심교양, 본전공필수, 본전공선택, 다전공필수, 다전공선택, 자유학점, 합계
+    return pd.DataFrame([row[:2] + row[3:] for row in plan], columns=SEMESTER_PLAN_COLUMNS_NO_SCIENCE), False
+
+
+def render_semester_plan_table(plan: List[SemesterPlan]):
     """학기별 이수 계획 테이블"""
     
     if not plan:
         st.info("이수할 학점이 없습니다.")
         return
     
-    # DataFrame으로 변환
-    df = pd.DataFrame(plan)
-    
-    # 기초교양(기초과학)이 모든 학기에서 0이면 해당 열 제거
-    has_basic_science = any(row.get('basic_science', 0) > 0 for row in plan)
-    
-    if has_basic_science:
-        # 기초과학이 있는 경우 - 순서: 학년/학기, 기초문해, 기초과학, 핵심교양, 본전공필수, 본전공선택, 다전공필수, 다전공선택, 자유학점, 합계
-        df.columns = ['학년/학기', '기초교양(기초문해)', '기초교양(기초과학)', '핵심교양', 
-                     '본전공 필수', '본전공 선택', '다전공 필수', '다전공 선택', '자유학점', '합계']
-        column_config = {
-            "학년/학기": st.column_config.TextColumn("학년/학기", width="medium"),
-            "기초교양(기초문해)": st.column_config.NumberColumn("기초교양(기초문해)", format="%d학점"),
-            "기초교양(기초과학)": st.column_config.NumberColumn("기초교양(기초과학)", format="%d학점"),
-            "핵심교양": st.column_config.NumberColumn("핵심교양", format="%d학점"),
-            "본전공 필수": st.column_config.NumberColumn("본전공 필수", format="%d학점"),
-            "본전공 선택": st.column_config.NumberColumn("본전공 선택", format="%d학점"),
-            "다전공 필수": st.column_config.NumberColumn("다전공 필수", format="%d학점"),
-            "다전공 선택": st.column_config.NumberColumn("다전공 선택", format="%d학점"),
-            "자유학점": st.column_config.NumberColumn("자유학점", format="%d학점"),
-            "합계": st.column_config.NumberColumn("합계", format="%d학점"),
-        }
-    else:
-        # 기초과학이 없는 경우 (열 제거) - 순서: 학년/학기, 기초문해, 핵심교양, 본전공필수, 본전공선택, 다전공필수, 다전공선택, 자유학점, 합계
-        df = df.drop(columns=['basic_science'])
-        df.columns = ['학년/학기', '기초교양(기초문해)', '핵심교양', 
-                     '본전공 필수', '본전공 선택', '다전공 필수', '다전공 선택', '자유학점', '합계']
-        column_config = {
-            "학년/학기": st.column_config.TextColumn("학년/학기", width="medium"),
-            "기초교양(기초문해)": st.column_config.NumberColumn("기초교양(기초문해)", format="%d학점"),
-            "핵심교양": st.column_config.NumberColumn("핵심교양", format="%d학점"),
-            "본전공 필수": st.column_config.NumberColumn("본전공 필수", format="%d학점"),
-            "본전공 선택": st.column_config.NumberColumn("본전공 선택", format="%d학점"),
-            "다전공 필수": st.column_config.NumberColumn("다전공 필수", format="%d학점"),
-            "다전공 선택": st.column_config.NumberColumn("다전공 선택", format="%d학점"),
-            "자유학점": st.column_config.NumberColumn("자유학점", format="%d학점"),
-            "합계": st.column_config.NumberColumn("합계", format="%d학점"),
-        }
+    df, has_basic_science = build_semester_plan_df(tuple(plan))
+    column_config = SEMESTER_PLAN_COLUMN_CONFIG if has_basic_science else SEMESTER_PLAN_COLUMN_CONFIG_NO_SCIENCE
     
     # 학기 컬럼은 이미 "X학년 X학기" 형식으로 들어오므로 추가 변환 불필요
     